@@ -11,50 +11,60 @@ import subprocess
 import webbrowser
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
 import re
+import shlex
+import shutil
+import tempfile
 import asyncio
+import queue
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
 import ctypes
+import contextlib
 import gc
+import hashlib
+import heapq
+import itertools
+from collections import OrderedDict, deque
 
 # GUI & System
 # customtkinter and PIL imported lazily in _setup_gui()
 import pystray
-import psutil
 
 # Voice & Audio
 import speech_recognition as sr
 import pyttsx3
-import pyautogui
+try:
+    import winsound  # Windows only: plays cached phrase audio from memory
+except ImportError:
+    winsound = None
+# pyautogui imported lazily (clip/screenshot and the media-key fallback only)
 import keyboard  # Global hotkey support
 
 # AI Providers
-import groq
-import google.generativeai as genai
+# groq imported lazily in BrainManager._init_groq() (only when a key is set)
+# Gemini is called over REST on BrainManager's shared httpx pool (real per-call timeout, no grpc)
 
 # Google Calendar
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+# google auth + googleapiclient imported lazily in CalendarManager._auth()
 
 # Smart Home
-try:
-    from kasa import Device, Discover
-    from kasa import Credentials as TapoCredentials
-    from kasa import DeviceConfig, Module
-except ImportError:
-    Device = None
-    Discover = None
-    TapoCredentials = None
-    DeviceConfig = None
-    Module = None
+# kasa imported lazily in LightManager._connect()
 
 # Utilities
 import pytz
 from dateutil import parser as date_parser
-import pywhatkit
+# pywhatkit imported lazily in execute_command() (YouTube only)
+
+try:
+    import orjson  # Optional: faster config load/save
+except ImportError:
+    orjson = None
 
 # ============================================================================
 # LOGGING
@@ -83,16 +93,206 @@ logging.getLogger('comtypes._post_coinit').setLevel(logging.WARNING)
 # ============================================================================
 CONFIG_FILE = Path.home() / ".linny" / "linny_config.json"
 TOKEN_FILE = Path.home() / ".linny" / "token.json"
+CALENDAR_META_FILE = TOKEN_FILE.parent / "calendar_meta.json"
+CALENDAR_META_MAX_AGE = 7 * 24 * 3600  # Re-resolve the School calendar weekly
+ENERGY_FILE = TOKEN_FILE.parent / "energy.json"
+ENERGY_MAX_AGE = 24 * 3600  # Re-calibrate ambient noise daily
 CREDENTIALS_FILE = Path("credentials.json")
 DEFAULT_CONFIG_FILE = Path("linny_config_default.json")
 CALENDAR_SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 
+# Wake words (includes common speech-recognition mishearings of "Linny")
+WAKE_WORDS = (
+    "linny", "lenny", "lini", "leni", "linnie", "lynny", "lanny", "leave me", "lily",
+    "mini", "minny", "minnie", "mimi",
+    "dini", "dinny",
+    "nini", "ninny", "ni",
+    "ginny", "hinny", "finny", "vinny", "winny", "pinny",
+    "lhinny",
+    "hey linny", "ok linny", "okay linny", "hi linny", "hello linny", "hey"
+)
+
+# Precompiled strippers: one regex pass instead of a .replace() per word
+# (longest alternatives first so "hey linny" wins over "hey")
+_WAKE_ALTERNATION = "|".join(sorted(map(re.escape, WAKE_WORDS), key=len, reverse=True))
+WAKE_STRIP_RE = re.compile(rf"\b(?:{_WAKE_ALTERNATION})\b")
+SONG_STRIP_RE = re.compile(rf"\b(?:on youtube|play|{_WAKE_ALTERNATION})\b")
+
+def _keyword_re(*words):
+    """Plain substring alternation: .search() == any(w in text for w in words), in one C-level scan"""
+    return re.compile("|".join(sorted(map(re.escape, words), key=len, reverse=True)))
+
+WAKE_RE = re.compile(_WAKE_ALTERNATION, re.IGNORECASE)  # Runs on the raw transcript, before .lower()
+
+# Intent keywords for execute_command (priority order is kept by the if-chain there)
+INTENT_RES = {
+    "shutdown": _keyword_re("shutdown", "shut down"),
+    "reboot": _keyword_re("reboot", "restart"),
+    "pc": _keyword_re("computer", "pc"),
+    "lights_on": _keyword_re("turn on lights", "lights on", "turn on the lights", "turn on bulb", "bulb on",
+                             "turn on the bulb", "buksan ilaw", "buksan ang ilaw"),
+    "lights_off": _keyword_re("turn off lights", "lights off", "turn off the lights", "turn off bulb", "bulb off",
+                              "turn off the bulb", "patayin ilaw", "patayin ang ilaw", "patay ilaw"),
+    "time": _keyword_re("time", "oras"),
+    "date": _keyword_re("date", "day"),
+    "schedule": _keyword_re("schedule", "calendar", "agenda"),
+    "weather": _keyword_re("weather", "panahon"),
+    "timer": _keyword_re("timer", "pomodoro"),
+    "clip": _keyword_re("clip that", "record that"),
+    "screenshot": _keyword_re("screenshot", "capture screen"),
+}
+
+# Timer duration: number + optional unit (defaults to minutes)
+TIMER_RE = re.compile(r"(\d+)\s*(h(?:ou)?rs?|min(?:ute)?s?|sec(?:ond)?s?|[hms])?\b", re.IGNORECASE)
+TIMER_UNITS = {"h": ("hour", 3600), "m": ("minute", 60), "s": ("second", 1)}
+
+# Open-Meteo WMO weather code -> (condition, advice); anything unlisted falls back to WMO_DEFAULT
+WMO_DEFAULT = ("cloudy", "Have a great day.")
+WMO_CONDITIONS = {
+    0: ("clear", "Wear sunscreen."),
+    **dict.fromkeys((1, 2, 3), ("cloudy", "It might rain later, consider bringing an umbrella.")),
+    **dict.fromkeys(range(45, 49), ("foggy", "Drive carefully, visibility is low.")),
+    **dict.fromkeys((*range(50, 68), *range(80, 87)), ("rainy", "Bring an umbrella.")),
+    **dict.fromkeys(range(95, 100), ("thunderstorms", "Stay indoors if possible.")),
+}
+
+# Media controls: (trigger pattern, media key, presses, reply, log message)
+# Checked in order, first match wins
+MEDIA_TABLE = (
+    (_keyword_re("resume", "unpause", "continue", "play music"), "playpause", 1, "Playing.", "⏯️ Media: Play"),
+    (_keyword_re("pause", "stop music"), "playpause", 1, "Paused.", "⏸️ Media: Pause"),
+    (_keyword_re("next", "skip"), "nexttrack", 1, "Next.", "⏭️ Media: Next"),
+    (_keyword_re("volume up", "louder"), "volumeup", 2, "Volume up.", "🔊 Media: Volume Up"),
+    (_keyword_re("volume down", "softer"), "volumedown", 2, "Volume down.", "🔉 Media: Volume Down"),
+)
+
+# ============================================================================
+# NATIVE MEDIA KEYS - Windows SendInput
+# ============================================================================
+INPUT_KEYBOARD = 1
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+MEDIA_VK_CODES = {
+    "volumemute": 0xAD,
+    "volumedown": 0xAE,
+    "volumeup": 0xAF,
+    "nexttrack": 0xB0,
+    "playpause": 0xB3,
+}
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_uint16),
+        ("wScan", ctypes.c_uint16),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+class _INPUTUNION(ctypes.Union):
+    # Mouse variant is the largest member; needed so sizeof(INPUT) matches Win32
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+class _INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", ctypes.c_uint32), ("u", _INPUTUNION)]
+
+def _build_key_inputs(vk, presses):
+    """Build a down/up INPUT array for `presses` taps of a virtual key"""
+    events = []
+    for _ in range(presses):
+        for flags in (KEYEVENTF_EXTENDEDKEY, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP):
+            events.append(_INPUT(type=INPUT_KEYBOARD, ki=_KEYBDINPUT(wVk=vk, dwFlags=flags)))
+    return (_INPUT * len(events))(*events)
+
+# Pre-built event sequences for every media action (one SendInput call each)
+_MEDIA_KEY_INPUTS = {
+    (key, presses): _build_key_inputs(MEDIA_VK_CODES[key], presses)
+    for _, key, presses, _, _ in MEDIA_TABLE
+}
+_MEDIA_KEY_INPUTS[("volumemute", 1)] = _build_key_inputs(MEDIA_VK_CODES["volumemute"], 1)
+
+def press_media_key(key, presses=1):
+    """Tap a media key `presses` times in one SendInput call (pyautogui fallback)"""
+    inputs = _MEDIA_KEY_INPUTS.get((key, presses))
+    if inputs is not None and sys.platform == "win32":
+        sent = ctypes.windll.user32.SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT))
+        if sent:
+            return
+        logger.debug("SendInput was blocked, falling back to pyautogui")
+    import pyautogui  # Lazy import
+    pyautogui.press(key, presses=presses)
+
+# ============================================================================
+# PROCESS PRIORITY - direct Win32 call (no psutil Process object)
+# ============================================================================
+HIGH_PRIORITY_CLASS = 0x00000080
+
+def set_high_priority():
+    """Raise this process's scheduling priority (raises OSError on failure)"""
+    if sys.platform == "win32":
+        kernel32 = ctypes.windll.kernel32
+        if not kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), HIGH_PRIORITY_CLASS):
+            raise ctypes.WinError()
+    else:
+        os.nice(-5)
+
+# ============================================================================
+# CONFIG IO - orjson when available, stdlib json otherwise
+# ============================================================================
+def load_json(path):
+    """Read a JSON file (raises json.JSONDecodeError on bad input either way)"""
+    if orjson:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def dump_json(path, data):
+    """
+    Write a JSON file indented by 2 (kept human-editable: "Edit Config" opens Notepad).
+    Written to a temp file and swapped in, so a crash mid-write never truncates the original.
+    """
+    path = Path(path)
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+# ============================================================================
+# TIME FORMATTING
+# ============================================================================
+@lru_cache(maxsize=8)
+def _format_minute(tz, fmt, epoch_minute):
+    """strftime for one wall-clock minute (memoized: output changes once a minute)"""
+    return datetime.fromtimestamp(epoch_minute * 60, tz).strftime(fmt)
+
+def format_now(tz, fmt):
+    """Format the current time in `tz` with minute-level memoization"""
+    return _format_minute(tz, fmt, int(time.time()) // 60)
+
 # ============================================================================
 # LIGHT MANAGER - Tapo L530E Smart Bulb
 # ============================================================================
 class LightManager:
     """Control Tapo L530E smart bulb via kasa with authentication"""
     
+    CALL_TIMEOUT = 5       # Seconds to wait for one bulb command
+    CONNECT_TIMEOUT = 15   # Discovery + first update
+    AUTH_MARKERS = ("auth", "credentials", "unauthorized", "401")
+    
     def __init__(self, config=None):
         """Initialize with config containing IP, email, and password"""
         if config is None:
@@ -103,7 +303,9 @@ class LightManager:
         self.tapo_email = config.get("tapo_email", "")
         self.tapo_password = config.get("tapo_password", "")
         self.bulb = None
-        self.loop = None  # Store event loop for reuse
+        self.loop = None  # Persistent event loop, run forever on its own thread
+        self._light_key = 'Light'  # kasa Module.Light once kasa is loaded
+        self._light = None  # Light module, resolved once after connecting
         self._connect()
     
     def _ensure_connected(self):
@@ -114,56 +316,88 @@ class LightManager:
         return True
     
     def _get_light_module(self):
-        """Get light module from bulb, returns None if not available"""
-        if Module and Module.Light in self.bulb.modules:
-            return self.bulb.modules[Module.Light]
+        """Light module resolved at connect time, None if the bulb has none"""
+        if self._light is None:
+            logger.error("Light module not available on this bulb")
+        return self._light
+    
+    def _resolve_light_module(self):
+        """Look up the light module once modules are loaded, returns None if not available"""
+        if self._light_key in self.bulb.modules:
+            return self.bulb.modules[self._light_key]
         elif 'Light' in self.bulb.modules:
             return self.bulb.modules['Light']
         else:
             logger.error(f"Light module not found. Available: {list(self.bulb.modules.keys())}")
             return None
     
-    def _log_auth_error(self):
-        """Log authentication error message"""
-        logger.error("❌ Tapo Authentication Failed. Please check your email and password in settings.")
+    def _run(self, coro, timeout=None):
+        """Run a coroutine on the bulb's loop thread and wait for its result"""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout=timeout or self.CALL_TIMEOUT)
+        except Exception:
+            future.cancel()
+            raise
+    
+    async def _discover(self, discover, **kwargs):
+        """Discover the bulb and load its modules"""
+        bulb = await discover.discover_single(self.ip, **kwargs)
+        await bulb.update()
+        return bulb
+    
+    def close(self):
+        """Stop the loop thread"""
+        if self.loop:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop = None
+    
+    def _log_auth_error(self, error):
+        """Log the authentication hint if `error` looks like a Tapo auth failure"""
+        message = str(error).lower()
+        if any(marker in message for marker in self.AUTH_MARKERS):
+            logger.error("❌ Tapo Authentication Failed. Please check your email and password in settings.")
     
     def _connect(self):
         """Connect to smart bulb with authentication"""
-        if Device is None:
+        try:
+            from kasa import Discover, Module  # Lazy import
+            from kasa import Credentials as TapoCredentials
+        except ImportError:
             logger.warning("kasa not installed, smart bulb disabled")
             return
+        self._light_key = Module.Light
+        
+        # One loop for the bulb's lifetime; callers block only on their own command
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True, name="linny-lights").start()
         
         try:
-            # Create and store event loop for reuse
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            
-            # Import Discover for device discovery
-            from kasa import Discover
-            
             # Use discover_single for Tapo devices (handles port 20002)
-            if self.tapo_email and self.tapo_password and TapoCredentials is not None:
+            if self.tapo_email and self.tapo_password:
                 logger.info(f"🔐 Discovering Tapo bulb with authentication: {self.ip}")
                 creds = TapoCredentials(username=self.tapo_email, password=self.tapo_password)
-                self.bulb = self.loop.run_until_complete(Discover.discover_single(self.ip, credentials=creds))
-                # Update device to load modules
-                self.loop.run_until_complete(self.bulb.update())
+                self.bulb = self._run(self._discover(Discover, credentials=creds), self.CONNECT_TIMEOUT)
+                self._light = self._resolve_light_module()
                 logger.info(f"✓ Smart bulb connected (authenticated): {self.ip}")
 
             else:
                 # Fallback to discovery without credentials
                 logger.info(f"🔌 Discovering bulb without authentication: {self.ip}")
-                self.bulb = self.loop.run_until_complete(Discover.discover_single(self.ip))
-                # Update device to load modules
-                self.loop.run_until_complete(self.bulb.update())
+                self.bulb = self._run(self._discover(Discover), self.CONNECT_TIMEOUT)
+                self._light = self._resolve_light_module()
                 logger.info(f"✓ Smart bulb connected: {self.ip}")
 
         except Exception as e:
             logger.warning(f"Smart bulb connection failed: {e}")
-            if "auth" in str(e).lower() or "credentials" in str(e).lower():
-                self._log_auth_error()
+            self._log_auth_error(e)
             self.bulb = None
-            self.loop = None
+            self.close()
+    
+    @staticmethod
+    async def _set_white(light, brightness, temp):
+        """Brightness and color temperature concurrently"""
+        await asyncio.gather(light.set_brightness(brightness), light.set_color_temp(temp))
     
     def set_mode(self, mode):
         """Set bulb mode: Focus, Movie, Gaming"""
@@ -179,25 +413,23 @@ class LightManager:
             if not light:
                 return
             
-            # Reuse the same event loop from connection
+            # Brightness + color temp are sent together in one scheduled coroutine
             if mode.lower() == "focus":
                 # 6000K, 100% brightness
                 logger.info("💡 Setting Focus mode: 6000K, 100% brightness")
-                self.loop.run_until_complete(light.set_brightness(100))
-                self.loop.run_until_complete(light.set_color_temp(6000))
+                self._run(self._set_white(light, 100, 6000))
                 logger.info("💡 Focus mode activated")
 
             elif mode.lower() == "movie":
                 # 2500K, 30% brightness
                 logger.info("🎬 Setting Movie mode: 2500K, 30% brightness")
-                self.loop.run_until_complete(light.set_brightness(30))
-                self.loop.run_until_complete(light.set_color_temp(2500))
+                self._run(self._set_white(light, 30, 2500))
                 logger.info("🎬 Movie mode activated")
 
             elif mode.lower() == "gaming":
                 # Purple HSV(280, 100, 60)
                 logger.info("🎮 Setting Gaming mode: Purple HSV(280, 100, 60)")
-                self.loop.run_until_complete(light.set_hsv(280, 100, 60))
+                self._run(light.set_hsv(280, 100, 60))
                 logger.info("🎮 Gaming mode activated")
                 
             else:
@@ -207,32 +439,29 @@ class LightManager:
             logger.error(f"Light module method not available: {e}")
         except Exception as e:
             logger.error(f"Failed to set mode: {e}", exc_info=True)
-            if "auth" in str(e).lower() or "credentials" in str(e).lower():
-                self._log_auth_error()
+            self._log_auth_error(e)
     
     def turn_on(self):
         """Turn on bulb"""
         if not self._ensure_connected():
             return
         try:
-            self.loop.run_until_complete(self.bulb.turn_on())
+            self._run(self.bulb.turn_on())
             logger.info("💡 Bulb turned on")
         except Exception as e:
             logger.error(f"Failed to turn on bulb: {e}")
-            if "auth" in str(e).lower() or "credentials" in str(e).lower():
-                self._log_auth_error()
+            self._log_auth_error(e)
     
     def turn_off(self):
         """Turn off bulb"""
         if not self._ensure_connected():
             return
         try:
-            self.loop.run_until_complete(self.bulb.turn_off())
+            self._run(self.bulb.turn_off())
             logger.info("🔦 Bulb turned off")
         except Exception as e:
             logger.error(f"Failed to turn off bulb: {e}")
-            if "auth" in str(e).lower() or "credentials" in str(e).lower():
-                self._log_auth_error()
+            self._log_auth_error(e)
 
     def set_brightness(self, level):
         """Set specific brightness level (0-100)"""
@@ -249,7 +478,7 @@ class LightManager:
             level = max(0, min(100, int(level)))
             
             logger.info(f"💡 Setting brightness to {level}%")
-            self.loop.run_until_complete(light.set_brightness(level))
+            self._run(light.set_brightness(level))
             return True
             
         except Exception as e:
@@ -283,54 +512,393 @@ class LightManager:
             
             if target == "warm":
                 # Warm White (2700K)
-                self.loop.run_until_complete(light.set_color_temp(2700))
+                self._run(light.set_color_temp(2700))
             else:
                 # HSV Colors
                 h, s, v = color_map[target]
-                self.loop.run_until_complete(light.set_hsv(h, s, v))
+                self._run(light.set_hsv(h, s, v))
                 
             return True
             
         except Exception as e:
             logger.error(f"Failed to set color: {e}")
             return False
+
+# ============================================================================
+# RESPONSE CACHE - Exact + Semantic AI answer reuse
+# ============================================================================
+class ResponseCache:
+    """
+    Two-tier cache for AI answers.
+    
+    Exact tier: normalized (query, user, language) hash -> answer, LRU + TTL.
+    Semantic tier: MiniLM sentence embeddings, cosine >= threshold. Only
+    active when sentence-transformers is installed; the model loads in the
+    background so it never delays startup or the first query.
+    
+    Follow-ups ("change it to red", "what about that") are context-chained:
+    they only hit entries whose previous query also matches, so the same
+    words asked in a different conversation are not mis-served.
+    """
+    
+    ENCODER_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+    
+    # Tokens that make a query depend on the previous turn
+    CONTEXT_TOKENS = frozenset({
+        "it", "its", "that", "this", "these", "those", "they", "them",
+        "he", "she", "him", "her", "there", "then", "again", "more",
+        "another", "else", "also", "too", "instead", "change",
+    })
+    
+    def __init__(self, max_entries=512, ttl=3600, threshold=0.92, context_threshold=0.85):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.threshold = threshold
+        self.context_threshold = context_threshold
+        self._lock = threading.Lock()
+        self._exact = OrderedDict()   # key -> (timestamp, response)
+        self._semantic = []           # [(timestamp, scope, embedding, context_embedding, response)]
+        self._encoder = None
+        threading.Thread(target=self._load_encoder, daemon=True).start()
+    
+    def _load_encoder(self):
+        """Load the embedding model if sentence-transformers is available"""
+        try:
+            from sentence_transformers import SentenceTransformer  # Optional dependency
+        except ImportError:
+            logger.info("sentence-transformers not installed, semantic cache disabled")
+            return
+        try:
+            self._encoder = SentenceTransformer(self.ENCODER_MODEL)
+            logger.info("✓ Semantic cache encoder loaded")
+        except Exception as e:
+            logger.warning(f"Semantic cache encoder failed: {e}")
+    
+    @staticmethod
+    def _normalize(query):
+        """Lowercase, drop punctuation, collapse whitespace"""
+        return " ".join(re.sub(r"[^\w\s]", " ", query.lower()).split())
+    
+    @classmethod
+    def _context_of(cls, normalized, prev_query):
+        """Normalized previous query if this query is a follow-up, else None"""
+        if prev_query and not cls.CONTEXT_TOKENS.isdisjoint(normalized.split()):
+            return cls._normalize(prev_query)
+        return None
+    
+    @staticmethod
+    def _key(normalized, context, scope):
+        """Stable hash of the normalized query, its context and (user, language) scope"""
+        payload = json.dumps({"q": normalized, "c": context, "u": scope[0], "l": scope[1]}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _embed(self, normalized):
+        """Unit-length embedding, or None if the semantic tier is unavailable"""
+        if self._encoder is None:
+            return None
+        try:
+            return self._encoder.encode(normalized, normalize_embeddings=True)
+        except Exception as e:
+            logger.warning(f"Embedding failed: {e}")
+            return None
+    
+    def get(self, query, user_name, language, prev_query=None):
+        """Return a cached answer or None"""
+        scope = (user_name, language)
+        normalized = self._normalize(query)
+        context = self._context_of(normalized, prev_query)
+        key = self._key(normalized, context, scope)
+        now = time.time()
+        
+        with self._lock:
+            hit = self._exact.get(key)
+            if hit:
+                if now - hit[0] < self.ttl:
+                    self._exact.move_to_end(key)
+                    return hit[1]
+                del self._exact[key]
+        
+        q_vec = self._embed(normalized)
+        if q_vec is None:
+            return None
+        c_vec = self._embed(context) if context else None
+        if context and c_vec is None:
+            return None
+        
+        with self._lock:
+            self._semantic = [e for e in self._semantic if now - e[0] < self.ttl]
+            best_score, best_response = 0.0, None
+            for _, entry_scope, vec, entry_c_vec, response in self._semantic:
+                if entry_scope != scope:
+                    continue
+                # Standalone queries only match standalone entries and vice versa
+                if (c_vec is None) != (entry_c_vec is None):
+                    continue
+                if c_vec is not None and float(entry_c_vec @ c_vec) < self.context_threshold:
+                    continue
+                score = float(vec @ q_vec)
+                if score > best_score:
+                    best_score, best_response = score, response
+        
+        if best_score >= self.threshold:
+            logger.info(f"✓ Semantic cache hit (similarity {best_score:.2f})")
+            return best_response
+        return None
+    
+    def put(self, query, user_name, language, response, prev_query=None):
+        """Store an answer in both tiers"""
+        scope = (user_name, language)
+        normalized = self._normalize(query)
+        context = self._context_of(normalized, prev_query)
+        key = self._key(normalized, context, scope)
+        now = time.time()
+        vec = self._embed(normalized)
+        c_vec = self._embed(context) if context else None
+        
+        with self._lock:
+            self._exact[key] = (now, response)
+            self._exact.move_to_end(key)
+            while len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
             
+            if vec is not None and (context is None or c_vec is not None):
+                self._semantic.append((now, scope, vec, c_vec, response))
+                if len(self._semantic) > self.max_entries:
+                    del self._semantic[0]
+
+class LatencyEWMA:
+    """Rolling provider latency (EWMA + recent p95) that derives an adaptive timeout"""
+    
+    MIN_TAIL_SAMPLES = 10  # Below this, p95 is noise - budget off the EWMA instead
+    
+    def __init__(self, initial, alpha=0.2, min_timeout=2.0, max_timeout=None, samples=50):
+        self.value = initial
+        self.alpha = alpha
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._samples = deque(maxlen=samples)
+        self._p95 = None
+    
+    @property
+    def timeout(self):
+        """
+        Budget for the next call: 2.5x the tail (p95) latency once known, else 2x the EWMA.
+        Clamped to [min_timeout, max_timeout] - the cap also stops timeouts (recorded at
+        the budget used) from ratcheting the budget up forever.
+        """
+        budget = 2.5 * self._p95 if self._p95 is not None else 2 * self.value
+        if self.max_timeout:
+            budget = min(budget, self.max_timeout)
+        return max(self.min_timeout, budget)
+    
+    def update(self, seconds):
+        """Fold in an observed latency (timeouts are recorded at the budget used)"""
+        self.value = (1 - self.alpha) * self.value + self.alpha * seconds
+        self._samples.append(seconds)
+        if len(self._samples) >= self.MIN_TAIL_SAMPLES:
+            ordered = sorted(self._samples)
+            self._p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    
+    def stats(self):
+        """p50/p99 over recent samples for observability"""
+        if not self._samples:
+            return {"ewma": round(self.value, 2), "p50": None, "p99": None}
+        ordered = sorted(self._samples)
+        p50 = ordered[len(ordered) // 2]
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return {"ewma": round(self.value, 2), "p50": round(p50, 2), "p99": round(p99, 2)}
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+    
+    closed -> (fail_threshold consecutive failures) -> open: provider skipped
+    open -> (open_secs elapsed) -> half-open: a single trial call is let through
+    half-open -> success closes the circuit, failure re-opens it
+    """
+    
+    def __init__(self, name, fail_threshold=3, open_secs=30):
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.open_secs = open_secs
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self):
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.open_secs:
+            return "open"
+        return "half-open"
+    
+    def allow(self):
+        """True if a call may be made now (claims the half-open trial slot)"""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+    
+    @property
+    def trial_ready(self):
+        """Half-open with the trial slot still free (peek only, allow() claims it)"""
+        return self.state == "half-open" and not self._trial_in_flight
+    
+    def release_trial(self):
+        """Give back a claimed trial slot whose call was dropped without an outcome"""
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"✓ {self.name} circuit closed")
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.fail_threshold:
+                if self._opened_at is None or self._trial_in_flight:
+                    logger.warning(f"⚡ {self.name} circuit open for {self.open_secs}s")
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
 class BrainManager:
-    """Cascading AI: Groq -> Gemini -> Perplexity (via requests)"""
+    """Hedged AI: Groq, + Gemini if Groq is slow (first answer wins) -> Perplexity"""
+    
+    TIMEOUT_CAPS = {"groq": 4.0, "gemini": 6.0, "perplexity": 8.0}  # Hard ceilings (config: ai_timeouts)
+    HEDGE_DELAY = 0.8  # Seconds before the backup provider is fired (config: ai_hedge_delay)
+    INIT_WAIT = 5.0    # Max seconds a first query waits for background provider init
+    GEMINI_MODEL = "gemini-2.0-flash-exp"
+    GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+    SYSTEM_TEMPLATE = "You are Linny, a helpful AI assistant. User: {user_name}. Language: {language}. Be concise (1-2 sentences)."
+    # Search intent: one precompiled alternation scanned once, case-insensitive
+    SEARCH_RE = re.compile(r"\b(?:search\w*|prices?|news|latest|who|what|how)\b", re.IGNORECASE)
+    # Subset only a live search can answer - chat models would just make it up
+    LIVE_RE = re.compile(r"\b(?:search\w*|prices?|news|latest)\b", re.IGNORECASE)
+    SEARCH_TTL = 60          # Seconds a search answer is reused (users repeat them)
+    SEARCH_CACHE_SIZE = 32
+    SEARCH_UNAVAILABLE = "Search is unavailable, try again later."
     
     def __init__(self, config):
         self.config = config
         self.groq_client = None
         self.gemini_model = None
-        self._init_providers()
+        # One keep-alive connection pool shared by the HTTP-based providers
+        self._http = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60),
+            timeout=httpx.Timeout(10.0, connect=3.0)
+        )
+        self._cache = ResponseCache()
+        self._search_answers = OrderedDict()  # (query, user, language) -> (expiry, answer)
+        self._search_lock = threading.Lock()
+        self.history = deque(maxlen=8)  # Recent (query, response) turns
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="linny-ai")
+        # Probes wait on their own race - never from a worker of the pool they submit to
+        self._probe_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="linny-ai-probe")
+        # Seeded with provider-typical latencies, adapted from real calls
+        caps = self._timeout_caps()
+        self._latency = {
+            "groq": LatencyEWMA(1.0, max_timeout=caps["groq"]),
+            "gemini": LatencyEWMA(6.5, max_timeout=caps["gemini"]),
+            "perplexity": LatencyEWMA(4.0, max_timeout=caps["perplexity"]),
+        }
+        self._sysmsg = {}  # (user_name, language) -> system message dict
+        # Known-down providers are skipped instead of paying their timeout
+        self._breakers = {name: CircuitBreaker(name.capitalize()) for name in self._latency}
+        self._perplexity_key = config.get("perplexity_api_key")
+        # SDK import (groq) overlaps with GUI/tray startup
+        self._ready = threading.Event()
+        threading.Thread(target=self._init_providers, daemon=True, name="linny-ai-init").start()
     
     def _init_providers(self):
-        """Initialize all AI providers"""
-        if self.config.get("groq_api_key"):
+        """Initialize all AI providers (background thread, sets _ready)"""
+        try:
+            self._init_groq()
+            self._init_gemini()
+        finally:
+            self._ready.set()
+    
+    def _init_groq(self):
+        """(Re)create the Groq client on the shared connection pool"""
+        self._groq_key = self.config.get("groq_api_key")
+        self.groq_client = None
+        if self._groq_key:
             try:
-                self.groq_client = groq.Groq(api_key=self.config["groq_api_key"])
+                import groq  # Lazy import
+                self.groq_client = groq.Groq(api_key=self._groq_key, http_client=self._http)
                 logger.info("✓ Groq initialized")
             except Exception as e:
                 logger.warning(f"Groq failed: {e}")
+    
+    def _init_gemini(self):
+        """(Re)configure Gemini - plain REST, so there is no SDK to build"""
+        self._gemini_key = self.config.get("gemini_api_key")
+        self.gemini_model = self.GEMINI_MODEL if self._gemini_key else None
+        if self.gemini_model:
+            logger.info("✓ Gemini initialized")
+    
+    def _timeout_caps(self):
+        """Per-provider timeout ceilings, config overrides on top of the defaults"""
+        return {**self.TIMEOUT_CAPS, **self.config.get("ai_timeouts", {})}
+    
+    def reconfigure(self, config):
+        """
+        Apply new settings in place.
         
-        if self.config.get("gemini_api_key"):
-            try:
-                genai.configure(api_key=self.config["gemini_api_key"])
-                self.gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
-                logger.info("✓ Gemini initialized")
-            except Exception as e:
-                logger.warning(f"Gemini failed: {e}")
+        Keeps the HTTP pool, response cache, history and latency stats warm;
+        only providers whose API key changed are rebuilt (and their circuit reset).
+        Perplexity reads its key per request, so it only needs the breaker reset.
+        """
+        self._ready.wait()
+        old_perplexity_key = self._perplexity_key
+        self.config = config
+        for name, cap in self._timeout_caps().items():
+            if name in self._latency:
+                self._latency[name].max_timeout = cap
+        if config.get("groq_api_key") != self._groq_key:
+            self._init_groq()
+            self._breakers["groq"].record_success()
+        if config.get("gemini_api_key") != self._gemini_key:
+            self._init_gemini()
+            self._breakers["gemini"].record_success()
+        self._perplexity_key = config.get("perplexity_api_key")
+        if self._perplexity_key != old_perplexity_key:
+            self._breakers["perplexity"].record_success()
+    
+    def _system_message(self, user_name, language):
+        """Same dict object per (user, language) so every request shares an identical prompt prefix"""
+        key = (user_name, language)
+        msg = self._sysmsg.get(key)
+        if msg is None:
+            msg = {"role": "system", "content": self.SYSTEM_TEMPLATE.format(user_name=user_name, language=language)}
+            self._sysmsg[key] = msg
+        return msg
     
     def _is_search(self, query):
         """Detect search intent"""
-        keywords = ["search", "price", "news", "latest", "who", "what", "how"]
-        return any(k in query.lower() for k in keywords)
+        return self.SEARCH_RE.search(query) is not None
     
-    def _ask_perplexity(self, query, system):
+    def _ask_perplexity(self, query, sysmsg):
         """Ask Perplexity via raw HTTP requests"""
         if not self.config.get("perplexity_api_key"):
             return None
+        breaker = self._breakers["perplexity"]
+        if not breaker.allow():
+            return None
         
+        latency = self._latency["perplexity"]
+        timeout = latency.timeout
+        start = time.monotonic()
         try:
             headers = {
                 "Authorization": f"Bearer {self.config['perplexity_api_key']}",
@@ -339,64 +907,263 @@ class BrainManager:
             payload = {
                 "model": "llama-3.1-sonar-small-128k-online",
                 "messages": [
-                    {"role": "system", "content": system},
+                    sysmsg,
                     {"role": "user", "content": query}
                 ]
             }
-            response = requests.post(
+            response = self._http.post(
                 "https://api.perplexity.ai/chat/completions",
                 json=payload,
                 headers=headers,
-                timeout=10
+                timeout=timeout
             )
             response.raise_for_status()
             data = response.json()
+            latency.update(time.monotonic() - start)
+            breaker.record_success()
             logger.info("✓ Perplexity responded")
             return data['choices'][0]['message']['content']
+        except httpx.TimeoutException:
+            latency.update(timeout)
+            breaker.record_failure()
+            logger.warning(f"Perplexity timed out after {timeout:.1f}s")
+            return None
         except Exception as e:
+            breaker.record_failure()
             logger.warning(f"Perplexity failed: {e}")
             return None
     
+    def _search_key(self, query, user_name, language):
+        """Search answers are keyed on the normalized query and (user, language)"""
+        return (ResponseCache._normalize(query), user_name, language)
+    
+    def _get_search_answer(self, key):
+        """Recent search answer or None"""
+        with self._search_lock:
+            hit = self._search_answers.get(key)
+            if hit and hit[0] > time.monotonic():
+                self._search_answers.move_to_end(key)
+                return hit[1]
+            self._search_answers.pop(key, None)
+            return None
+    
+    def _put_search_answer(self, key, answer):
+        """Remember a search answer for SEARCH_TTL seconds (bounded LRU)"""
+        with self._search_lock:
+            self._search_answers[key] = (time.monotonic() + self.SEARCH_TTL, answer)
+            self._search_answers.move_to_end(key)
+            while len(self._search_answers) > self.SEARCH_CACHE_SIZE:
+                self._search_answers.popitem(last=False)
+    
     def ask(self, query, user_name="User", language="English"):
-        """Cascading ask: Search -> Perplexity, Chat -> Groq, Error -> Gemini"""
-        system = f"You are Linny, a helpful AI assistant. User: {user_name}. Language: {language}. Be concise (1-2 sentences)."
-        
+        """Cached ask: reuse recent answers, otherwise run the provider cascade"""
+        if not self._ready.wait(self.INIT_WAIT):
+            logger.warning("AI providers still initializing")
         is_search = self._is_search(query)
+        prev_query = self.history[-1][0] if self.history else None
         
+        if is_search:
+            search_key = self._search_key(query, user_name, language)
+            cached = self._get_search_answer(search_key)
+            if cached:
+                logger.info("✓ Search answered from cache")
+                self.history.append((query, cached))
+                return cached
+            # Live-data query while Perplexity is known down: fail fast instead of
+            # cascading through chat models that can't answer it anyway
+            if (self._perplexity_key and self._breakers["perplexity"].state == "open"
+                    and self.LIVE_RE.search(query)):
+                logger.info("Search skipped: Perplexity circuit open")
+                return self.SEARCH_UNAVAILABLE
+        
+        # Search/news answers go stale quickly - never serve them from cache
+        if not is_search:
+            cached = self._cache.get(query, user_name, language, prev_query)
+            if cached:
+                logger.info("✓ Answered from cache")
+                self.history.append((query, cached))
+                return cached
+        
+        result = self._ask_providers(query, self._system_message(user_name, language), is_search)
+        if not result:
+            return "All AI systems are offline. Please check your API keys."
+        
+        if is_search:
+            self._put_search_answer(search_key, result)
+        else:
+            self._cache.put(query, user_name, language, result, prev_query)
+        self.history.append((query, result))
+        return result
+    
+    def _ask_groq(self, query, sysmsg):
+        """Ask Groq, returns None on failure (run under _race, which records the breaker outcome)"""
+        try:
+            response = self.groq_client.chat.completions.create(
+                model="llama-3.3-70b-versatile",
+                messages=[sysmsg, {"role": "user", "content": query}],
+                temperature=0.7, max_tokens=500,
+                timeout=self._latency["groq"].timeout
+            )
+            logger.info("✓ Groq responded")
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.warning(f"Groq failed: {e}")
+            return None
+    
+    def _ask_gemini(self, query, sysmsg):
+        """Ask Gemini, returns None on failure (run under _race, which records the breaker outcome)"""
+        try:
+            # REST instead of the SDK: its generate_content() has no per-call timeout,
+            # so a hung call would pin an AI worker long after _race gave up on it
+            response = self._http.post(
+                self.GEMINI_URL.format(model=self.gemini_model),
+                headers={"x-goog-api-key": self._gemini_key},
+                json={"contents": [{"parts": [{"text": f"{sysmsg['content']}\n\nUser: {query}"}]}]},
+                timeout=self._latency["gemini"].timeout
+            )
+            response.raise_for_status()
+            logger.info("✓ Gemini responded")
+            return response.json()["candidates"][0]["content"]["parts"][0]["text"]
+        except Exception as e:
+            logger.warning(f"Gemini failed: {e}")
+            return None
+    
+    def close(self):
+        """Release the worker pool and pooled HTTP connections"""
+        self._probe_pool.shutdown(wait=False, cancel_futures=True)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._http.close()
+    
+    def latency_stats(self):
+        """Per-provider latency EWMA and p50/p99"""
+        return {name: ewma.stats() for name, ewma in self._latency.items()}
+    
+    def status(self):
+        """Per-provider circuit state + latency (for the dashboard)"""
+        return {
+            name: {"circuit": self._breakers[name].state, **self._latency[name].stats()}
+            for name in self._latency
+        }
+    
+    def _race(self, calls, query, sysmsg):
+        """
+        Hedged race over provider calls (in preference order), first non-empty answer wins.
+        
+        The first provider starts at once; the next is only fired if no answer
+        arrived within the hedge delay (or immediately, if everything in flight
+        already failed). Each provider gets its own adaptive deadline; one that
+        blows its budget is dropped so the caller can fail over immediately.
+        
+        The race is the single place breaker outcomes are recorded for these calls:
+        an answer, an error/empty reply, or a blown deadline counts exactly once.
+        A half-open trial slot is only claimed when a call is actually launched, and
+        handed back for every call the race drops without an outcome. Deadlines run
+        from when a worker starts the call, so queue time is never charged to it.
+        """
+        hedge_delay = self.config.get("ai_hedge_delay", self.HEDGE_DELAY)
+        queued = deque(calls)
+        pending = {}  # future -> (name, submitted, budget, started)
+        next_launch = time.monotonic()
+        
+        try:
+            while pending or queued:
+                now = time.monotonic()
+                if queued and (not pending or now >= next_launch):
+                    name, call = queued.popleft()
+                    if not self._breakers[name].allow():
+                        continue  # Opened meanwhile, or another trial holds the slot
+                    started = []  # Filled in by the worker once the call really begins
+                    future = self._pool.submit(self._timed, started, call, query, sysmsg)
+                    pending[future] = (name, now, self._latency[name].timeout, started)
+                    next_launch = now + hedge_delay
+                    continue
+                
+                # The budget runs from when the worker picks the call up; until then
+                # it doubles as the limit on how long the call may sit in the queue
+                wake = min((started[0] if started else submitted) + budget
+                           for _, submitted, budget, started in pending.values())
+                if queued:
+                    wake = min(wake, next_launch)
+                done, _ = wait(pending, timeout=max(0, wake - now), return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    name, _, _, started = pending.pop(future)
+                    result = future.result()
+                    if result:
+                        self._latency[name].update(time.monotonic() - started[0])
+                        self._breakers[name].record_success()
+                        return result
+                    self._breakers[name].record_failure()
+                
+                now = time.monotonic()
+                for future, (name, submitted, budget, started) in list(pending.items()):
+                    if started:
+                        if now >= started[0] + budget:
+                            del pending[future]
+                            self._latency[name].update(budget)
+                            self._breakers[name].record_failure()
+                            logger.warning(f"{name.capitalize()} timed out after {budget:.1f}s")
+                    elif now >= submitted + budget and future.cancel():
+                        # Never ran: the provider did nothing wrong, so no outcome or sample
+                        del pending[future]
+                        self._breakers[name].release_trial()
+                        logger.warning(f"{name.capitalize()} never started (AI workers busy)")
+        finally:
+            # Losers may still be in flight; their answers are simply dropped
+            for future, (name, *_) in pending.items():
+                future.cancel()
+                self._breakers[name].release_trial()
+        return None
+    
+    @staticmethod
+    def _timed(started, call, query, sysmsg):
+        """Run a raced call, stamping when a worker actually began it"""
+        started.append(time.monotonic())
+        return call(query, sysmsg)
+    
+    def _chat_calls(self):
+        """
+        Sticky routing over the chat providers (preference order).
+        
+        Only closed circuits serve user queries. A half-open provider is revived
+        by a background probe instead - unless nothing else is up, in which case
+        the user's query is the trial. Trial slots are claimed by _race at launch.
+        """
+        configured = [(name, call) for name, call, ready in (
+            ("groq", self._ask_groq, self.groq_client),
+            ("gemini", self._ask_gemini, self.gemini_model),
+        ) if ready]
+        healthy = [(name, call) for name, call in configured if self._breakers[name].state == "closed"]
+        if not healthy:
+            return [(name, call) for name, call in configured if self._breakers[name].trial_ready]
+        
+        for name, call in configured:
+            if (name, call) not in healthy and self._breakers[name].trial_ready:
+                self._probe_pool.submit(self._probe, name, call)
+        return healthy
+    
+    def _probe(self, name, call):
+        """Background half-open trial; _race enforces the deadline and records the outcome"""
+        logger.info(f"🩺 Probing {name.capitalize()}...")
+        self._race([(name, call)], "ping", self._system_message("User", "English"))
+    
+    def _ask_providers(self, query, sysmsg, is_search):
+        """Search -> Perplexity, Chat -> hedged race(Groq, Gemini), Error -> Perplexity"""
         # Search/News queries -> Perplexity first
         if is_search:
-            result = self._ask_perplexity(query, system)
+            result = self._ask_perplexity(query, sysmsg)
             if result:
                 return result
         
-        # Regular chat -> Groq
-        if self.groq_client:
-            try:
-                response = self.groq_client.chat.completions.create(
-                    model="llama-3.3-70b-versatile",
-                    messages=[{"role": "system", "content": system}, {"role": "user", "content": query}],
-                    temperature=0.7, max_tokens=500
-                )
-                logger.info("✓ Groq responded")
-                return response.choices[0].message.content
-            except Exception as e:
-                logger.warning(f"Groq failed: {e}")
-        
-        # Fallback to Gemini
-        if self.gemini_model:
-            try:
-                response = self.gemini_model.generate_content(f"{system}\n\nUser: {query}")
-                logger.info("✓ Gemini responded")
-                return response.text
-            except Exception as e:
-                logger.warning(f"Gemini failed: {e}")
+        # Regular chat -> Groq, Gemini hedged in if Groq is slow; first answer wins
+        calls = self._chat_calls()
+        if calls:
+            result = self._race(calls, query, sysmsg)
+            if result:
+                return result
         
         # Last resort: Perplexity general query
-        result = self._ask_perplexity(query, system)
-        if result:
-            return result
-        
-        return "All AI systems are offline. Please check your API keys."
+        return self._ask_perplexity(query, sysmsg)
 
 # ============================================================================
 # CALENDAR MANAGER
@@ -404,14 +1171,26 @@ class BrainManager:
 class CalendarManager:
     """Google Calendar with smart schedule filtering"""
     
+    TIME_FMT = "%I:%M %p"
+    SCHEDULE_TTL = 60
+    # Only what the schedule summary reads - Google's full event resource is ~5x bigger
+    EVENT_FIELDS = "items(start,end,summary)"
+    
     def __init__(self, timezone="Asia/Manila"):
         self.service = None
         self.timezone = pytz.timezone(timezone)
         self.school_cal_id = None
+        self._schedule_cache = {}  # is_tomorrow -> (date, monotonic expiry, summary)
         self._auth()
     
     def _auth(self):
         """Authenticate with Google Calendar"""
+        # Lazy imports - keep the Google client stack off the startup path
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+        
         creds = None
         
         if TOKEN_FILE.exists():
@@ -431,9 +1210,33 @@ class CalendarManager:
             with open(TOKEN_FILE, 'w') as f:
                 f.write(creds.to_json())
         
-        self.service = build('calendar', 'v3', credentials=creds)
+        # Bundled discovery doc (no network fetch); the legacy discovery cache only
+        # probes for oauth2client and logs a warning, so skip it
+        self.service = build('calendar', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
         logger.info("✓ Google Calendar authenticated")
-        self._find_school_cal()
+        if not self._load_school_cal():
+            self._find_school_cal()
+    
+    def _load_school_cal(self):
+        """Load cached School calendar ID, returns False if missing or stale"""
+        try:
+            if time.time() - CALENDAR_META_FILE.stat().st_mtime > CALENDAR_META_MAX_AGE:
+                return False
+            with open(CALENDAR_META_FILE, 'r') as f:
+                self.school_cal_id = json.load(f)["school_calendar_id"]
+            logger.info(f"✓ School calendar (cached): {self.school_cal_id or 'not found, using primary'}")
+            return True
+        except (OSError, ValueError, KeyError):
+            return False
+    
+    def _save_school_cal(self):
+        """Persist resolved School calendar ID next to the OAuth token"""
+        try:
+            CALENDAR_META_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(CALENDAR_META_FILE, 'w') as f:
+                json.dump({"school_calendar_id": self.school_cal_id}, f)
+        except OSError as e:
+            logger.warning(f"Could not cache School calendar: {e}")
     
     def _find_school_cal(self):
         """Find School calendar"""
@@ -441,11 +1244,14 @@ class CalendarManager:
             return
         try:
             cals = self.service.calendarList().list().execute()
+            self.school_cal_id = None
             for cal in cals.get('items', []):
                 if cal.get('summary', '').lower() == 'school':
                     self.school_cal_id = cal['id']
                     logger.info(f"✓ School calendar: {self.school_cal_id}")
-                    return
+                    break
+            # Cache the result (including "no School calendar") to skip this call next start
+            self._save_school_cal()
         except Exception as e:
             logger.warning(f"Could not find School calendar: {e}")
     
@@ -455,81 +1261,152 @@ class CalendarManager:
             return self.timezone.localize(dt)
         return dt
     
+    def _events_request(self, cal_id, day_start):
+        """Build (don't execute) an events().list request for one day"""
+        return self.service.events().list(
+            calendarId=cal_id,
+            timeMin=day_start.isoformat(),
+            timeMax=(day_start + timedelta(days=1)).isoformat(),
+            singleEvents=True,
+            orderBy='startTime',
+            fields=self.EVENT_FIELDS
+        )
+    
+    def _fetch_days(self, cal_id, day_starts):
+        """
+        Fetch events for several days in one HTTP round-trip (batch request).
+        
+        Args:
+            day_starts: {label: day_start datetime}
+        Returns:
+            {label: [event, ...]}
+        """
+        if len(day_starts) == 1:
+            (label, day_start), = day_starts.items()
+            return {label: self._events_request(cal_id, day_start).execute().get('items', [])}
+        
+        results = {}
+        errors = []
+        
+        def _on_response(request_id, response, exception):
+            if exception is not None:
+                errors.append(exception)
+            else:
+                results[request_id] = response.get('items', [])
+        
+        batch = self.service.new_batch_http_request(callback=_on_response)
+        for label, day_start in day_starts.items():
+            batch.add(self._events_request(cal_id, day_start), request_id=label)
+        batch.execute()
+        
+        if errors:
+            raise errors[0]
+        return results
+    
+    @staticmethod
+    def _parse_time(value):
+        """Parse Google's RFC3339 / all-day date strings (C fast path, dateutil fallback)"""
+        try:
+            if value.endswith("Z"):
+                value = value[:-1] + "+00:00"
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return date_parser.parse(value)
+    
+    def _active_events(self, events, now, label):
+        """Parse events, drop finished ones (today only), ongoing first"""
+        ongoing = []
+        upcoming = []
+        
+        parse = self._parse_time
+        aware = self._ensure_timezone_aware
+        skip_finished = label == "today"
+        for event in events:
+            end = event['end']
+            end_t = aware(parse(end.get('dateTime') or end['date']))
+            if skip_finished and end_t < now:
+                continue  # Finished - don't bother parsing the start
+            
+            start = event['start']
+            start_t = aware(parse(start.get('dateTime') or start['date']))
+            if start_t < now < end_t:
+                ongoing.append((event, start_t, end_t))
+            else:
+                upcoming.append((event, start_t, end_t))
+        
+        return ongoing + upcoming
+    
+    def _format_events(self, active, now):
+        """One bullet per (event, start, end) - ongoing events show their end time"""
+        fmt = self.TIME_FMT
+        bullets = []
+        for event, start_t, end_t in active:
+            name = event.get('summary', 'Untitled')
+            if start_t < now < end_t:
+                bullets.append(f"- {name} (Ongoing, ends {end_t.strftime(fmt)})")
+            else:
+                bullets.append(f"- {name} ({start_t.strftime(fmt)} to {end_t.strftime(fmt)})")
+        return bullets
+    
     def get_schedule(self, query=""):
-        """Get schedule with smart intent detection"""
+        """Get schedule with smart intent detection (answers reused for SCHEDULE_TTL seconds)"""
         if not self.service:
             return "Calendar not configured."
         
+        query_lower = query.lower() if query else ""
+        is_tomorrow_request = any(w in query_lower for w in ["tomorrow", "bukas", "next day"])
         try:
             now = datetime.now(self.timezone)
-            query_lower = query.lower() if query else ""
-            is_tomorrow_request = any(w in query_lower for w in ["tomorrow", "bukas", "next day"])
-            
-            if is_tomorrow_request:
-                logger.info("📅 Tomorrow schedule requested")
-                target_day = now + timedelta(days=1)
-                day_start = target_day.replace(hour=0, minute=0, second=0, microsecond=0)
-                day_end = day_start + timedelta(days=1)
-                label = "tomorrow"
-            else:
-                logger.info("📅 Today/Smart schedule requested")
-                day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                day_end = day_start + timedelta(days=1)
-                label = "today"
-            
-            cal_id = self.school_cal_id or 'primary'
-            events_result = self.service.events().list(
-                calendarId=cal_id,
-                timeMin=day_start.isoformat(),
-                timeMax=day_end.isoformat(),
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
-            ongoing = []
-            upcoming = []
-            
-            for event in events:
-                start_str = event['start'].get('dateTime', event['start'].get('date'))
-                end_str = event['end'].get('dateTime', event['end'].get('date'))
-                
-                start_t = date_parser.parse(start_str)
-                end_t = date_parser.parse(end_str)
-                
-                start_t = self._ensure_timezone_aware(start_t)
-                end_t = self._ensure_timezone_aware(end_t)
-                
-                if label == "today" and end_t < now:
-                    continue
-                elif start_t < now < end_t:
-                    ongoing.append((event, start_t, end_t))
-                else:
-                    upcoming.append((event, start_t, end_t))
-            
-            active = ongoing + upcoming
-            
-            # SMART SWITCH: If today is empty, try tomorrow
-            if not active and label == "today" and not is_tomorrow_request:
-                logger.info("📅 Today empty, switching to tomorrow")
-                return self.get_schedule("tomorrow")
-            
-            if not active:
-                return f"You have no schedule for {label}."
+            cached = self._schedule_cache.get(is_tomorrow_request)
+            if cached and cached[0] == now.date() and time.monotonic() < cached[1]:
+                logger.info("📅 Schedule from cache")
+                return cached[2]
             
-            day_name = "Tomorrow" if label == "tomorrow" else "Today"
-            summary = f"{day_name}: {len(active)} event(s)\n"
-            for event, start_t, end_t in active[:5]:
-                name = event.get('summary', 'Untitled')
-                if start_t < now < end_t:
-                    summary += f"- {name} (Ongoing, ends {end_t.strftime('%I:%M %p')})\n"
-                else:
-                    summary += f"- {name} ({start_t.strftime('%I:%M %p')} to {end_t.strftime('%I:%M %p')})\n"
-            
-            return summary.strip()
+            summary = self._build_schedule(now, is_tomorrow_request)
+            self._schedule_cache[is_tomorrow_request] = (now.date(), time.monotonic() + self.SCHEDULE_TTL, summary)
+            return summary
         except Exception as e:
+            # Cached School calendar was deleted/unshared: re-resolve and retry once
+            stale_id = self.school_cal_id
+            if stale_id and getattr(getattr(e, 'resp', None), 'status', None) == 404:
+                logger.warning("School calendar not found (404), refreshing calendar ID")
+                self._find_school_cal()
+                if self.school_cal_id != stale_id:
+                    return self.get_schedule(query)
             logger.error(f"Calendar error: {e}")
             return "Could not access calendar."
+    
+    def _build_schedule(self, now, is_tomorrow_request):
+        """Fetch and summarize today's (or tomorrow's) events"""
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        tomorrow_start = today_start + timedelta(days=1)
+        cal_id = self.school_cal_id or 'primary'
+        
+        if is_tomorrow_request:
+            logger.info("📅 Tomorrow schedule requested")
+            events = self._fetch_days(cal_id, {"tomorrow": tomorrow_start})
+            label = "tomorrow"
+        else:
+            # Fetch tomorrow alongside today so the smart switch costs no extra RTT
+            logger.info("📅 Today/Smart schedule requested")
+            events = self._fetch_days(cal_id, {"today": today_start, "tomorrow": tomorrow_start})
+            label = "today"
+        
+        active = self._active_events(events[label], now, label)
+        
+        # SMART SWITCH: If today is empty, use tomorrow
+        if not active and label == "today":
+            logger.info("📅 Today empty, switching to tomorrow")
+            label = "tomorrow"
+            active = self._active_events(events[label], now, label)
+        
+        if not active:
+            return f"You have no schedule for {label}."
+        
+        day_name = "Tomorrow" if label == "tomorrow" else "Today"
+        lines = [f"{day_name}: {len(active)} event(s)"]
+        lines += self._format_events(active[:5], now)
+        return "\n".join(lines)
 
 # ============================================================================
 # VOICE ENGINE - TTS Only
@@ -537,6 +1414,15 @@ class CalendarManager:
 class VoiceEngine:
     """Offline TTS Engine using pyttsx3 - Zero Latency, No Network Dependencies"""
     
+    SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+    # Short phrases ("Volume up.", "Opening Spotify.") repeat constantly: once a phrase
+    # has been said twice it is rendered to WAV (after speaking, never in front of it)
+    # and replayed from memory. One-offs like the current time only pass through
+    # the seen-set, so they never evict real repeats. Long answers always use say().
+    WAV_CACHE_SIZE = 64
+    WAV_CACHE_MAX_CHARS = 60
+    SEEN_PHRASES_SIZE = 128
+    
     def __init__(self, voice=None):
         """
         Initialize pyttsx3 engine with optimal settings for Linny.
@@ -545,7 +1431,8 @@ class VoiceEngine:
             voice: Optional voice ID. If None, selects first female voice.
         """
         self.engine = pyttsx3.init()
-        self.is_speaking = False
+        self._idle = threading.Event()
+        self._idle.set()
         self._interrupt = False
         
         # Get available voices
@@ -559,7 +1446,8 @@ class VoiceEngine:
         else:
             # Try to find female voice (usually Zira on Windows)
             for v in available_voices:
-                if 'zira' in v.name.lower() or 'female' in v.name.lower():
+                name = v.name.lower()
+                if 'zira' in name or 'female' in name:
                     selected_voice = v.id
                     break
             
@@ -570,15 +1458,50 @@ class VoiceEngine:
                 selected_voice = available_voices[0].id
         
         # Apply voice and settings
+        self.voice = selected_voice
+        self._lock = threading.Lock()  # Engine property writes vs. in-flight synthesis
         if selected_voice:
             self.engine.setProperty('voice', selected_voice)
         self.engine.setProperty('rate', 150)      # Speech rate (words per minute)
         self.engine.setProperty('volume', 1.0)    # Volume (0.0 to 1.0)
+        
+        self._wav_cache = OrderedDict()  # (voice, text) -> WAV bytes, worker thread only
+        self._seen_phrases = OrderedDict()  # (voice, text) said once, not yet cached
+        
+        # One long-lived speech worker instead of a new thread per utterance
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._speech_worker, daemon=True, name="linny-tts")
+        self._worker.start()
+    
+    @property
+    def is_speaking(self):
+        return not self._idle.is_set()
+    
+    @is_speaking.setter
+    def is_speaking(self, value):
+        if value:
+            self._idle.clear()
+        else:
+            self._idle.set()
+    
+    def wait_idle(self, timeout=None):
+        """Block until the current utterance finishes (no polling)"""
+        return self._idle.wait(timeout)
     
     def stop(self):
         """Stop current speech immediately"""
         self._interrupt = True
+        # Drop anything still queued behind the current utterance
         try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        if not self.is_speaking:
+            return  # runAndWait() already returned - engine.stop() would only churn the driver
+        try:
+            if winsound:
+                winsound.PlaySound(None, 0)  # Cut off a cached phrase mid-playback
             self.engine.stop()
         except Exception as e:
             logger.error(f"Error stopping TTS: {e}")
@@ -587,36 +1510,114 @@ class VoiceEngine:
     
     def speak(self, text, callback=None):
         """
-        Speak text asynchronously in a separate thread (non-blocking).
+        Queue text for the speech worker (non-blocking).
         
         Args:
             text: Text to speak
             callback: Optional function to call when speech finishes
         """
-        def _thread():
+        self._interrupt = False
+        self.is_speaking = True  # Mark busy now so the mic doesn't pick up the gap
+        self._queue.put((text, callback))
+    
+    def _speech_worker(self):
+        """Speak queued utterances in order on a single thread"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            text, callback = item
+            learn = False
             try:
-                self._interrupt = False
                 self.is_speaking = True
                 
-                # Speak synchronously (pyttsx3 blocks until done or stopped)
-                self.engine.say(text)
-                self.engine.runAndWait()
+                cacheable = winsound and len(text) <= self.WAV_CACHE_MAX_CHARS
+                if not (cacheable and self._play_cached(text)):
+                    self._say_sentences(text)
+                    learn = cacheable and not self._interrupt
                 
             except Exception as e:
                 logger.error(f"TTS error: {e}")
             finally:
-                self.is_speaking = False
+                if self._queue.empty():
+                    self.is_speaking = False
                 if callback:
                     try:
                         callback()
                     except Exception as e:
                         logger.error(f"Callback error: {e}")
-        
-        threading.Thread(target=_thread, daemon=True).start()
+            
+            # Off the latency path: the phrase was already heard and its callback ran
+            if learn:
+                self._learn_phrase(text)
+    
+    def _say_sentences(self, text):
+        """
+        Sentence by sentence: first words start sooner and stop() takes
+        effect at the next boundary even if the driver ignores engine.stop()
+        """
+        for sentence in self.SENTENCE_RE.split(text):
+            if self._interrupt:
+                break
+            with self._lock:
+                self.engine.say(sentence)
+                self.engine.runAndWait()
+    
+    def _play_cached(self, text):
+        """Play a short phrase from the WAV cache. False if it isn't cached."""
+        key = (self.voice, text)
+        wav = self._wav_cache.get(key)
+        if wav is None:
+            return False
+        self._wav_cache.move_to_end(key)
+        if not self._interrupt:
+            winsound.PlaySound(wav, winsound.SND_MEMORY)  # Blocks like runAndWait()
+        return True
+    
+    def _learn_phrase(self, text):
+        """Remember a phrase that was just said; render it to the cache the second time"""
+        key = (self.voice, text)
+        if self._seen_phrases.pop(key, None) is None:
+            self._seen_phrases[key] = True
+            while len(self._seen_phrases) > self.SEEN_PHRASES_SIZE:
+                self._seen_phrases.popitem(last=False)
+            return
+        if not self._queue.empty():
+            # A reply is waiting - never make it queue behind a render; count this as the
+            # first sighting again so a later, idle repeat caches it
+            self._seen_phrases[key] = True
+            return
+        wav = self._synthesize(text)
+        if wav is not None:
+            self._wav_cache[key] = wav
+            while len(self._wav_cache) > self.WAV_CACHE_SIZE:
+                self._wav_cache.popitem(last=False)
+    
+    def _synthesize(self, text):
+        """Render text to WAV bytes with the current voice, None on failure"""
+        fd, path = tempfile.mkstemp(suffix=".wav", prefix="linny-tts-")
+        os.close(fd)
+        try:
+            with self._lock:
+                self.engine.save_to_file(text, path)
+                self.engine.runAndWait()
+            return Path(path).read_bytes() or None
+        except Exception as e:
+            logger.warning(f"TTS cache synthesis failed: {e}")
+            return None
+        finally:
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+    
+    def close(self):
+        """Stop the speech worker"""
+        self._queue.put(None)
     
     def set_voice(self, voice):
-        """Change voice"""
-        self.voice = voice
+        """Change voice in place (applies from the next sentence, no engine rebuild)"""
+        with self._lock:
+            self.engine.setProperty('voice', voice)
+            self.voice = voice
 
 # ============================================================================
 # SYSTEM TRAY MANAGER
@@ -624,12 +1625,22 @@ class VoiceEngine:
 class TrayManager:
     """System tray icon with state colors"""
     
+    STATE_COLORS = {"listening": "green", "speaking": "blue", "muted": "red"}
+    DEBOUNCE_SECS = 0.15
+    
     def __init__(self, on_show, on_mute, on_exit):
         self.icon = None
         self.on_show = on_show
         self.on_mute = on_mute
         self.on_exit = on_exit
         self.state = "listening"
+        self._shown = None  # State currently painted on the tray icon
+        self._timer = None
+        self._timer_lock = threading.Lock()
+        
+        # Pre-render one icon per state (fixed palette) instead of per update
+        self._icons = {state: self._img(color) for state, color in self.STATE_COLORS.items()}
+        self._icons["default"] = self._img("gray")
     
     def _img(self, color):
         """Create colored circle"""
@@ -649,29 +1660,86 @@ class TrayManager:
     
     def start(self):
         """Start tray"""
-        img = self._img('green')
+        img = self._icons.get(self.state, self._icons["default"])
+        self._shown = self.state
         self.icon = pystray.Icon("L.I.N.N.Y.", img, "L.I.N.N.Y. v9.4", self._menu())
         threading.Thread(target=self.icon.run, daemon=True).start()
         logger.info("✓ Tray started")
     
     def update_state(self, state):
-        """Update icon color"""
+        """Update icon color (trailing debounce: only the last state in a burst is drawn)"""
+        if state == self.state:
+            return  # Already shown, or already what the pending timer will apply
         self.state = state
-        if self.icon:
-            colors = {"listening": "green", "speaking": "blue", "muted": "red"}
-            self.icon.icon = self._img(colors.get(state, "gray"))
+        with self._timer_lock:
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.DEBOUNCE_SECS, self._apply_state)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _apply_state(self):
+        """Push the latest state to the icon"""
+        state = self.state
+        if self.icon and state != self._shown:  # Skip the redundant Shell_NotifyIcon round-trip
+            self.icon.icon = self._icons.get(state, self._icons["default"])
+            self._shown = state
     
     def stop(self):
         """Stop tray"""
+        with self._timer_lock:
+            if self._timer:
+                self._timer.cancel()
         if self.icon:
             self.icon.stop()
 
+# ============================================================================
+# TIMER SCHEDULER - One thread for every pending voice timer
+# ============================================================================
+class TimerScheduler:
+    """Run callbacks after a delay; pending timers are heap entries, not sleeping threads"""
+    
+    def __init__(self):
+        self._heap = []  # (due monotonic time, seq, callback)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+    
+    def call_later(self, delay, callback):
+        """Schedule callback() to run in `delay` seconds"""
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="linny-timers")
+                self._thread.start()
+            self._cond.notify()
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                remaining = self._heap[0][0] - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)  # Woken early if a sooner timer is added
+                    continue
+                _, _, callback = heapq.heappop(self._heap)
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Timer callback error: {e}")
+
 # ============================================================================
 # LINNY ASSISTANT - Core Logic + Listening
 # ============================================================================
 class LinnyAssistant:
     """Handles listening, command processing, and logic"""
     
+    WEATHER_TTL = 600
+    MAX_PENDING_COMMANDS = 6
+    WEATHER_TIMEOUT = (2.0, 5.0)  # (connect, read) seconds
+    DETACHED_FLAGS = 0x00000008 | 0x00000200  # DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+    
     def __init__(self, config, voice, calendar, brain, lights, tray=None):
         self.config = config
         self.voice = voice
@@ -682,12 +1750,37 @@ class LinnyAssistant:
         
         self.is_listening = False
         self.is_muted = False
+        self.tz = pytz.timezone(self.config.get("timezone", "Asia/Manila"))  # Resolved once, not per query
+        self._timers = TimerScheduler()
+        # Keeps the Open-Meteo connection warm; transient 5xx/connect errors retried with backoff
+        self._weather_session = requests.Session()
+        self._weather_session.mount("https://", HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        ))
+        self._weather_cache = (0.0, None)  # (monotonic fetch time, spoken report)
+        self._resolved_apps = {}  # Complex launch command -> argv with absolute exe (None = needs the shell)
+        
+        # Bound once: every spoken reply reuses the same completion callback
+        self._speak_done = self._on_speak_done
         
         self.recognizer = sr.Recognizer()
         # Allow user to configure specific microphone from config
         mic_index = self.config.get("microphone_index", None)
         self.microphone = sr.Microphone(device_index=mic_index) if mic_index is not None else sr.Microphone()
         self._audio_source = None
+        self._mic_stack = contextlib.ExitStack()  # Owns the open PortAudio stream
+        
+        # Recognition runs off the capture thread so the mic keeps listening
+        # while Google STT round-trips are in flight
+        self._recognize_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="linny-stt")
+        # Commands run on a small reusable pool instead of a fresh thread each
+        self._command_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="linny-cmd")
+        # Back-pressure: at most 3 running + 3 queued commands, extra utterances are dropped
+        self._command_slots = threading.BoundedSemaphore(self.MAX_PENDING_COMMANDS)
+        # AI answers take seconds; give them their own lane so quick commands never queue behind them
+        self._brain_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="linny-brain")
         
         # Log which microphone is being used
         if mic_index is not None:
@@ -698,11 +1791,18 @@ class LinnyAssistant:
                 pass
     
     def _get_weather(self):
+        """Weather report, reused for WEATHER_TTL seconds (conditions change on ~10 min scales)"""
+        fetched_at, report = self._weather_cache
+        if report and time.monotonic() - fetched_at < self.WEATHER_TTL:
+            return report
+        return self._fetch_weather()
+    
+    def _fetch_weather(self):
         """Fetch weather from Open-Meteo with contextual advice"""
         try:
             # Coordinates for Anahaw 2, Bulihan, Silang, Cavite, Philippines
             url = "https://api.open-meteo.com/v1/forecast?latitude=14.2167&longitude=120.9833&current_weather=true&timezone=Asia%2FManila"
-            resp = requests.get(url, timeout=10)
+            resp = self._weather_session.get(url, timeout=self.WEATHER_TIMEOUT)
             resp.raise_for_status()
             data = resp.json()
             cw = data.get('current_weather') or {}
@@ -712,31 +1812,13 @@ class LinnyAssistant:
             if temp is None:
                 return "I couldn't read the temperature."
             
-            condition = 'unknown'
-            advice = ''
+            condition, advice = WMO_CONDITIONS.get(code, WMO_DEFAULT)
             
-            if code == 0:
-                condition = 'clear'
-                advice = 'Wear sunscreen.'
-            elif code in (1, 2, 3):
-                condition = 'cloudy'
-                advice = 'It might rain later, consider bringing an umbrella.'
-            elif 45 <= code <= 48:
-                condition = 'foggy'
-                advice = 'Drive carefully, visibility is low.'
-            elif 50 <= code <= 67 or 80 <= code <= 86:
-                condition = 'rainy'
-                advice = 'Bring an umbrella.'
-            elif code >= 95:
-                condition = 'thunderstorms'
-                advice = 'Stay indoors if possible.'
-            else:
-                condition = 'cloudy'
-                advice = 'Have a great day.'
-            
-            return f"It is {round(temp)} degrees and {condition}. {advice}"
+            report = f"It is {round(temp)} degrees and {condition}. {advice}"
+            self._weather_cache = (time.monotonic(), report)  # Only real readings are cached
+            return report
         except requests.exceptions.Timeout:
-            logger.warning(f"Weather API timeout after 10 seconds")
+            logger.warning(f"Weather API timeout (connect/read budget {self.WEATHER_TIMEOUT})")
             return "Weather service is slow."
         except requests.exceptions.RequestException as e:
             logger.warning(f"Weather API request failed: {e}")
@@ -748,27 +1830,80 @@ class LinnyAssistant:
     def _start_timer(self, text):
         """Start background timer"""
         try:
-            match = re.search(r'(\d+)', text)
+            match = TIMER_RE.search(text)
             if match:
-                minutes = int(match.group(1))
-                def timer():
-                    time.sleep(minutes * 60)
-                    self.voice.speak(f"Your {minutes} minute timer is done!")
-                
-                threading.Thread(target=timer, daemon=True).start()
-                self.voice.speak(f"Timer set for {minutes} minutes.")
+                amount = int(match.group(1))
+                unit, seconds = TIMER_UNITS[(match.group(2) or "m")[0].lower()]
+                done_msg = f"Your {amount} {unit} timer is done!"
+                self._timers.call_later(amount * seconds, lambda: self._say(done_msg))
+                self._say(f"Timer set for {amount} {unit}{'' if amount == 1 else 's'}.")
             else:
-                self.voice.speak("I couldn't understand the duration.")
+                self._say("I couldn't understand the duration.")
         except Exception as e:
             logger.error(f"Timer failed: {e}")
-            self.voice.speak("Timer failed.")
+            self._say("Timer failed.")
+    
+    def _post_launch_unmute(self):
+        """Speech callback: unmute mic 2 seconds after launch TTS completes"""
+        # Runs on the TTS worker - schedule instead of sleeping so queued speech isn't held up
+        self._timers.call_later(2.0, self._unmute)
+    
+    def _unmute(self):
+        """Timer callback: re-open the mic after a launch (the done-callback left the tray on "muted")"""
+        self.is_muted = False
+        if self.tray and not self.voice.is_speaking:
+            self.tray.update_state("listening")
+    
+    def _start_detached(self, target):
+        """
+        Plain executables: CreateProcess, fully detached (skips ShellExecute/COM).
+        Protocols, documents and App Paths names (e.g. "chrome") still need os.startfile().
+        """
+        if target.endswith(".exe"):
+            try:
+                subprocess.Popen(
+                    [target],
+                    creationflags=self.DETACHED_FLAGS,
+                    close_fds=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                return
+            except OSError:
+                pass  # Not on PATH - let the shell resolve it
+        os.startfile(target)
+    
+    def _resolve_command(self, target):
+        """
+        Split a launch command and resolve its executable once (cached).
+        Returns None when it needs cmd.exe (builtins, pipes/redirects, quoted
+        arguments, not on PATH) - cmd.exe then gets the command verbatim.
+        """
+        if target in self._resolved_apps:
+            return self._resolved_apps[target]
+        argv = None
+        if not any(ch in target for ch in "&|<>^%"):
+            try:
+                parts = shlex.split(target, posix=False)
+            except ValueError:
+                parts = []
+            # Only a fully quoted exe path is unquoted; quotes inside arguments
+            # would be re-escaped by Popen's list quoting, so leave those to cmd.exe
+            args = parts[1:]
+            exe = None
+            if parts and not any('"' in arg for arg in args):
+                exe = shutil.which(parts[0].strip('"'))
+            if exe:
+                argv = [os.path.abspath(exe)] + args
+        self._resolved_apps[target] = argv
+        return argv
     
     def _launch_app(self, app_name):
         """
         Smart App Launcher with 3-case logic:
         Case A: URL (http/www) → webbrowser.open()
         Case B: System App/Protocol (no args) → os.startfile()
-        Case C: Complex Command (args/spaces) → subprocess.Popen(shell=True)
+        Case C: Complex Command (args/spaces) → resolved argv, shell only as fallback
         
         Mutes mic immediately to prevent echo, unmutes 2s after TTS completes.
         """
@@ -782,11 +1917,6 @@ class LinnyAssistant:
         self.is_muted = True
         time.sleep(0.15)  # Give listening loop time to detect mute flag
         
-        def _post_launch_unmute():
-            """Callback to unmute mic 2 seconds after TTS completes"""
-            time.sleep(2)
-            self.is_muted = False
-        
         try:
             # ================================================================
             # CASE A: URL (starts with http or www)
@@ -794,7 +1924,7 @@ class LinnyAssistant:
             if target.startswith("http://") or target.startswith("https://") or target.startswith("www"):
                 logger.info(f"📡 Case A: URL → {target}")
                 webbrowser.open(target)
-                self.voice.speak(f"Opening {app_name}.", callback=_post_launch_unmute)
+                self._say(f"Opening {app_name}.", then=self._post_launch_unmute)
                 return
             
             # ================================================================
@@ -804,8 +1934,8 @@ class LinnyAssistant:
             
             if not has_args:
                 logger.info(f"💻 Case B: System App → {target}")
-                os.startfile(target)
-                self.voice.speak(f"Opening {app_name}.", callback=_post_launch_unmute)
+                self._start_detached(target)
+                self._say(f"Opening {app_name}.", then=self._post_launch_unmute)
                 return
             
             # ================================================================
@@ -813,26 +1943,49 @@ class LinnyAssistant:
             # ================================================================
             logger.info(f"⚙️ Case C: Complex Command → {target}")
             
+            # Resolved commands skip the cmd.exe cold start; anything else still goes through the shell
+            argv = self._resolve_command(target)
+            command = argv or target
+            
             # For Riot Client commands, do NOT suppress output (keeps launcher alive)
             is_riot_client = "riotclient" in target.lower()
             
             if is_riot_client:
                 logger.debug("🎮 Riot Client detected - preserving output streams")
-                subprocess.Popen(target, shell=True)
+                subprocess.Popen(command, shell=argv is None)
             else:
                 # For other commands, suppress output
                 subprocess.Popen(
-                    target,
-                    shell=True,
+                    command,
+                    shell=argv is None,
+                    creationflags=self.DETACHED_FLAGS if argv else 0,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
                 )
             
-            self.voice.speak(f"Opening {app_name}.", callback=_post_launch_unmute)
+            self._say(f"Opening {app_name}.", then=self._post_launch_unmute)
         
         except Exception as e:
             logger.error(f"Failed to launch {app_name}: {e}")
-            self.voice.speak(f"Couldn't find {app_name}.", callback=_post_launch_unmute)
+            self._say(f"Couldn't find {app_name}.", then=self._post_launch_unmute)
+    
+    def _on_speak_done(self):
+        """TTS finished: restore the tray from 'speaking'"""
+        if self.tray:
+            self.tray.update_state("muted" if self.is_muted else "listening")
+    
+    def _say(self, msg, then=None):
+        """Speak a reply with the tray showing the speaking state; then() runs after TTS"""
+        if self.tray:
+            self.tray.update_state("speaking")
+        if then is None:
+            self.voice.speak(msg, callback=self._speak_done)
+            return
+        
+        def _done():
+            then()
+            self._speak_done()
+        self.voice.speak(msg, callback=_done)
     
     def execute_command(self, text):
         """
@@ -840,53 +1993,48 @@ class LinnyAssistant:
         Priority 1: System | 2: Media | 3: Lights | 4: Apps | 5: Time | 6: Date |
                  7: Calendar | 8: Weather | 9: Timer | 10: Clip | 11: YouTube | 12: AI
         """
-        text_lower = text.lower()
-        
-        # Wake word check
-        wake_words = [
-            "linny", "lenny", "lini", "leni", "linnie", "lynny", "lanny", "leave me", "lily",
-            "mini", "minny", "minnie", "mimi",
-            "dini", "dinny",
-            "nini", "ninny", "ni",
-            "ginny", "hinny", "finny", "vinny", "winny", "pinny",
-            "lhinny",
-            "hey linny", "ok linny", "okay linny", "hi linny", "hello linny", "hey"
-        ]
-        
-        if not any(w in text_lower for w in wake_words):
+        # Wake word check (case-insensitive, so rejects skip the .lower() copy)
+        if not WAKE_RE.search(text):
             logger.debug(f"No wake word in: {text}")
             return
         
+        text_lower = text.lower()
+        
         logger.info(f"💬 Command: {text}")
         
+        # Hot path: bind frequently used attributes to locals once
+        speak = self._say
+        lights = self.lights
+        intent = INTENT_RES
+        
         # ====================================================================
         # PRIORITY 1: SYSTEM COMMANDS
         # ====================================================================
         
-        if any(w in text_lower for w in ["shutdown", "shut down"]):
+        if intent["shutdown"].search(text_lower):
             logger.info("⚡ System: Shutdown")
             logger.info("💡 Lights: Off")
-            self.lights.turn_off()
-            self.voice.speak("Shutting down the System.")
+            lights.turn_off()
+            speak("Shutting down the System.")
             time.sleep(3)
             threading.Timer(3.0, lambda: os.system("shutdown /s /t 0")).start()
             return
         
-        if any(w in text_lower for w in ["reboot", "restart", "Reboot", "Restart"]):
+        if intent["reboot"].search(text_lower):
             logger.info("⚡ System: Reboot")
-            self.voice.speak("Rebooting the System.")
+            speak("Rebooting the System.")
             threading.Timer(3.0, lambda: os.system("shutdown /r /t 0")).start()
             return
         
-        if "lock" in text_lower and any(w in text_lower for w in ["computer", "pc"]):
+        if "lock" in text_lower and intent["pc"].search(text_lower):
             logger.info("🔒 System: Lock")
-            self.voice.speak("Locking the System.")
+            speak("Locking the System.")
             threading.Timer(1.0, lambda: ctypes.windll.user32.LockWorkStation()).start()
             return
         
-        if "sleep" in text_lower and any(w in text_lower for w in ["computer", "pc"]):
+        if "sleep" in text_lower and intent["pc"].search(text_lower):
             logger.info("💤 System: Sleep")
-            self.voice.speak("Putting the System to sleep.")
+            speak("Putting the System to sleep.")
             threading.Timer(1.0, lambda: os.system("rundll32.exe powrprof.dll,SetSuspendState 0,1,0")).start()
             return
         
@@ -894,42 +2042,17 @@ class LinnyAssistant:
         # PRIORITY 2: MEDIA CONTROLS
         # ====================================================================
         
-        if any(w in text_lower for w in ["resume", "unpause", "continue", "play music"]):
-            logger.info("⏯️ Media: Play")
-            pyautogui.press("playpause")
-            self.voice.speak("Playing.")
-            return
-        
-        if any(w in text_lower for w in ["pause", "stop music"]):
-            logger.info("⏸️ Media: Pause")
-            pyautogui.press("playpause")
-            self.voice.speak("Paused.")
-            return
-        
-        if any(w in text_lower for w in ["next", "skip"]):
-            logger.info("⏭️ Media: Next")
-            pyautogui.press("nexttrack")
-            self.voice.speak("Next.")
-            return
-        
-        if any(w in text_lower for w in ["volume up", "louder"]):
-            logger.info("🔊 Media: Volume Up")
-            for _ in range(2):
-                pyautogui.press("volumeup")
-            self.voice.speak("Volume up.")
-            return
-        
-        if any(w in text_lower for w in ["volume down", "softer"]):
-            logger.info("🔉 Media: Volume Down")
-            for _ in range(2):
-                pyautogui.press("volumedown")
-            self.voice.speak("Volume down.")
-            return
+        for pattern, key, presses, reply, log_msg in MEDIA_TABLE:
+            if pattern.search(text_lower):
+                logger.info(log_msg)
+                press_media_key(key, presses)
+                speak(reply)
+                return
         
         if "mute" in text_lower and "unmute" not in text_lower:
             logger.info("🔇 Media: Mute")
-            pyautogui.press("volumemute")
-            self.voice.speak("Muted.")
+            press_media_key("volumemute")
+            speak("Muted.")
             return
         
         # ====================================================================
@@ -942,10 +2065,10 @@ class LinnyAssistant:
             if match:
                 level = int(match.group(1))
                 logger.info(f"💡 Lights: Set to {level}%")
-                if self.lights.set_brightness(level):
-                    self.voice.speak(f"Lights set to {level} percent.")
+                if lights.set_brightness(level):
+                    speak(f"Lights set to {level} percent.")
                 else:
-                    self.voice.speak("I couldn't set the brightness.")
+                    speak("I couldn't set the brightness.")
                 return
 
         # Color Control
@@ -953,40 +2076,40 @@ class LinnyAssistant:
             for color in ["red", "blue", "violet", "green", "warm"]:
                 if color in text_lower:
                     logger.info(f"🎨 Lights: Color {color}")
-                    if self.lights.set_color(color):
-                        self.voice.speak(f"Lights changed to {color}.")
+                    if lights.set_color(color):
+                        speak(f"Lights changed to {color}.")
                     else:
-                        self.voice.speak(f"I couldn't change the color to {color}.")
+                        speak(f"I couldn't change the color to {color}.")
                     return
         
-        if any(w in text_lower for w in ["turn on lights", "lights on", "turn on the lights", "turn on bulb", "bulb on", "turn on the bulb", "buksan ilaw", "buksan ang ilaw"]):
+        if intent["lights_on"].search(text_lower):
             logger.info("💡 Lights: On")
-            self.lights.turn_on()
-            self.voice.speak("Lights turned on.")
+            lights.turn_on()
+            speak("Lights turned on.")
             return
         
-        if any(w in text_lower for w in ["turn off lights", "lights off", "turn off the lights", "turn off bulb", "bulb off", "turn off the bulb", "patayin ilaw", "patayin ang ilaw", "patay ilaw"]):
+        if intent["lights_off"].search(text_lower):
             logger.info("💡 Lights: Off")
-            self.lights.turn_off()
-            self.voice.speak("Lights turned off.")
+            lights.turn_off()
+            speak("Lights turned off.")
             return
         
         if "focus mode" in text_lower or "focus" in text_lower:
             logger.info("💡 Lights: Focus Mode")
-            self.lights.set_mode("focus")
-            self.voice.speak("Focus mode activated.")
+            lights.set_mode("focus")
+            speak("Focus mode activated.")
             return
         
         if "movie mode" in text_lower or "movie" in text_lower:
             logger.info("💡 Lights: Movie Mode")
-            self.lights.set_mode("movie")
-            self.voice.speak("Movie mode activated.")
+            lights.set_mode("movie")
+            speak("Movie mode activated.")
             return
         
         if "gaming mode" in text_lower or "gaming" in text_lower or "game mode" in text_lower:
             logger.info("💡 Lights: Gaming Mode")
-            self.lights.set_mode("gaming")
-            self.voice.speak("Gaming mode activated.")
+            lights.set_mode("gaming")
+            speak("Gaming mode activated.")
             return
              
         # ====================================================================
@@ -1002,8 +2125,7 @@ class LinnyAssistant:
                     break
         
         if app_name:
-            for wake_word in wake_words:
-                app_name = app_name.replace(wake_word, "").strip()
+            app_name = " ".join(WAKE_STRIP_RE.sub("", app_name).split())
             
             self._launch_app(app_name)
             return
@@ -1012,49 +2134,47 @@ class LinnyAssistant:
         # PRIORITY 5: TIME
         # ====================================================================
         
-        if any(w in text_lower for w in ["time", "oras", "what time"]):
+        if intent["time"].search(text_lower):
             logger.info("🕐 Time")
-            tz = pytz.timezone(self.config.get("timezone", "Asia/Manila"))
-            time_str = datetime.now(tz).strftime("%I:%M %p")
-            self.voice.speak(f"It is {time_str}.")
+            time_str = format_now(self.tz, "%I:%M %p")
+            speak(f"It is {time_str}.")
             return
         
         # ====================================================================
         # PRIORITY 6: DATE
         # ====================================================================
         
-        if any(w in text_lower for w in ["date", "day", "what day", "what is today"]):
+        if intent["date"].search(text_lower):
             logger.info("📅 Date")
-            tz = pytz.timezone(self.config.get("timezone", "Asia/Manila"))
-            date_str = datetime.now(tz).strftime("%A, %B %d, %Y")
-            self.voice.speak(f"Today is {date_str}.")
+            date_str = format_now(self.tz, "%A, %B %d, %Y")
+            speak(f"Today is {date_str}.")
             return
         
         # ====================================================================
         # PRIORITY 7: CALENDAR
         # ====================================================================
         
-        if any(w in text_lower for w in ["schedule", "calendar", "agenda"]):
+        if intent["schedule"].search(text_lower):
             logger.info("📅 Schedule")
             schedule = self.calendar.get_schedule(query=text)
-            self.voice.speak(schedule)
+            speak(schedule)
             return
         
         # ====================================================================
         # PRIORITY 8: WEATHER
         # ====================================================================
         
-        if any(w in text_lower for w in ["weather", "panahon"]):
+        if intent["weather"].search(text_lower):
             logger.info("🌤️ Weather")
             weather = self._get_weather()
-            self.voice.speak(weather)
+            speak(weather)
             return
         
         # ====================================================================
         # PRIORITY 9: TIMER
         # ====================================================================
         
-        if any(w in text_lower for w in ["timer", "set timer", "pomodoro", "set a timer"]):
+        if intent["timer"].search(text_lower):
             logger.info("⏱️ Timer")
             self._start_timer(text_lower)
             return
@@ -1063,13 +2183,14 @@ class LinnyAssistant:
         # PRIORITY 10: CLIP and SCREENSHOT
         # ====================================================================
         
-        if any(w in text_lower for w in ["clip that", "record that"]):
+        if intent["clip"].search(text_lower):
             logger.info("📸 Clip")
+            import pyautogui  # Lazy import
             pyautogui.hotkey('alt', 'f10')
-            self.voice.speak("Clipped.")
+            speak("Clipped.")
             return
         
-        if any(w in text_lower for w in ["screenshot", "take a screenshot", "capture screen", "take screenshot"]):
+        if intent["screenshot"].search(text_lower):
             logger.info("📸 Screenshot")
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             
@@ -1077,12 +2198,13 @@ class LinnyAssistant:
             try:
                 folder_path.mkdir(parents=True, exist_ok=True)
                 file_path = folder_path / f"screenshot_{timestamp}.png"
+                import pyautogui  # Lazy import
                 pyautogui.screenshot(str(file_path))
                 time.sleep(1)
-                self.voice.speak("Fullscreen screenshot taken.")
+                speak("Fullscreen screenshot taken.")
             except Exception as e:
                 logger.error(f"Screenshot failed: {e}")
-                self.voice.speak("I couldn't take the screenshot.")
+                speak("I couldn't take the screenshot.")
             return
 
         # ====================================================================
@@ -1090,23 +2212,22 @@ class LinnyAssistant:
         # ====================================================================
         
         if "play" in text_lower and "youtube" in text_lower:
-            song = text_lower.replace("play", "").replace("on youtube", "").strip()
-            for w in wake_words:
-                song = song.replace(w, "").strip()
+            song = " ".join(SONG_STRIP_RE.sub("", text_lower).split())
             
             if song and len(song) > 2:
                 logger.info(f"🎵 YouTube: {song}")
                 try:
+                    import pywhatkit  # Lazy import
                     pywhatkit.playonyt(song)
-                    self.voice.speak(f"Playing {song}.")
+                    speak(f"Playing {song}.")
                 except Exception as e:
                     logger.error(f"YouTube failed: {e}")
-                    self.voice.speak("YouTube failed.")
+                    speak("YouTube failed.")
                 return
             
         if "stop listening" in text_lower:
             logger.info("🛑 Stop Listening Command Received")
-            self.voice.speak("Stopping listening. Goodbye!")
+            speak("Stopping listening. Goodbye!")
             self.toggle_mute()
             if self.tray:
                 self.tray.update_state("muted")
@@ -1117,36 +2238,76 @@ class LinnyAssistant:
         # ====================================================================
         
         logger.info("🤖 AI Brain")
-        response = self.brain.ask(
-            text,
-            user_name=self.config.get("user_name", "User"),
-            language=self.config.get("language", "English")
-        )
-        self.voice.speak(response)
+        self._brain_pool.submit(self._answer, text)
+    
+    def _answer(self, text):
+        """Brain pool: ask the AI cascade and speak the answer"""
+        try:
+            response = self.brain.ask(
+                text,
+                user_name=self.config.get("user_name", "User"),
+                language=self.config.get("language", "English")
+            )
+            self._say(response)
+        except Exception as e:
+            logger.exception(f"AI answer error: {e}")
+    
+    def _dispatch(self, text):
+        """Queue a recognized utterance on the command pool (dropped if the backlog is full)"""
+        if not self._command_slots.acquire(blocking=False):
+            logger.warning(f"⏳ Command backlog full, dropping: {text}")
+            return
+        self._command_pool.submit(self._run_command, text)
+    
+    def _run_command(self, text):
+        """Command pool entry: executor futures swallow exceptions, so log them here"""
+        try:
+            self.execute_command(text)
+        except Exception as e:
+            logger.exception(f"Command error: {e}")
+        finally:
+            self._command_slots.release()
+    
+    def _recognize(self, audio):
+        """Recognize captured audio and dispatch the command (runs in STT pool)"""
+        try:
+            text = self.recognizer.recognize_google(audio, language='en-US')
+            logger.info(f"✨ Recognized: {text}")
+            self._dispatch(text)
+        except sr.UnknownValueError:
+            # Try alternative language (Tagalog/Filipino)
+            try:
+                text = self.recognizer.recognize_google(audio, language='fil-PH')
+                logger.info(f"✨ Recognized (Tagalog): {text}")
+                self._dispatch(text)
+            except sr.UnknownValueError:
+                logger.info("🔇 No speech detected in audio")
+            except sr.RequestError as e:
+                logger.warning(f"API error: {e}")
+        except sr.RequestError as e:
+            logger.warning(f"API error: {e}")
+        except Exception as e:
+            logger.exception(f"Recognition error: {e}")
     
     def _listen_loop(self):
         """IMMORTAL Non-Blocking Listening Loop"""
         logger.info("🎤 Listening loop started...")
         source = self._audio_source
-        cycle = 0
-        no_speech_count = 0
         timeout_count = 0
         
         while self.is_listening:
             try:
                 # STRICT AUDIO LOCKING
                 while self.voice.is_speaking or self.is_muted:
-                    time.sleep(0.1)
-                
-                cycle += 1
-                if cycle % 500 == 0:
-                    gc.collect()
+                    if self.voice.is_speaking:
+                        self.voice.wait_idle(1.0)
+                    else:
+                        time.sleep(0.1)
                 
                 if source is None:
                     logger.warning("Audio source lost, re-opening...")
                     try:
-                        source = self.microphone.__enter__()
-                        self._audio_source = source
+                        source = self._open_audio_source()
                         logger.info("✓ Audio source reopened")
                     except Exception as e:
                         logger.error(f"Re-open failed: {e}")
@@ -1168,52 +2329,62 @@ class LinnyAssistant:
                     if timeout_count % 10 == 0:
                         logger.info(f"⏱️ Timeout waiting for speech (listening, no sound detected)")
                     continue
-                except sr.UnknownValueError:
-                    no_speech_count += 1
-                    if no_speech_count % 5 == 0:
-                        logger.info(f"🔇 No speech detected in audio")
-                    continue
-                except sr.RequestError as e:
-                    logger.warning(f"Recognition error: {e}")
-                    continue
                 except Exception as e:
                     logger.exception(f"Audio error: {e}")
                     time.sleep(0.5)
                     continue
                 
-                # Recognize
-                try:
-                    no_speech_count = 0
-                    text = self.recognizer.recognize_google(audio, language='en-US')
-                    logger.info(f"✨ Recognized: {text}")
-                    threading.Thread(target=self.execute_command, args=(text,), daemon=True).start()
-                except sr.UnknownValueError:
-                    # Try alternative language (Tagalog/Filipino)
-                    try:
-                        text = self.recognizer.recognize_google(audio, language='fil-PH')
-                        logger.info(f"✨ Recognized (Tagalog): {text}")
-                        threading.Thread(target=self.execute_command, args=(text,), daemon=True).start()
-                    except sr.UnknownValueError:
-                        no_speech_count += 1
-                        logger.info("🔇 No speech detected in audio")
-                        continue
-                except sr.RequestError as e:
-                    logger.warning(f"API error: {e}")
-                    time.sleep(1)
-                    continue
-                except Exception as e:
-                    logger.exception(f"Recognition error: {e}")
-                    continue
+                # Recognize (pipelined: capture resumes immediately; STT errors are handled in _recognize)
+                self._recognize_pool.submit(self._recognize, audio)
                     
             except Exception as e:
                 logger.exception(f"[LOOP ERROR] {e}")
                 try:
-                    self.voice.speak("I encountered a glitch, but I'm back online.")
+                    self._say("I encountered a glitch, but I'm back online.")
                 except Exception:
                     pass
                 time.sleep(0.5)
                 continue
     
+    def _open_audio_source(self):
+        """(Re)open the microphone stream, closing any previous one first"""
+        self._close_audio_source()
+        self._audio_source = self._mic_stack.enter_context(self.microphone)
+        return self._audio_source
+    
+    def _close_audio_source(self):
+        """Close the microphone stream if open (every open gets exactly one close)"""
+        self._audio_source = None
+        try:
+            self._mic_stack.close()
+        except Exception as e:
+            logger.warning(f"Close audio failed: {e}")
+    
+    def _load_energy_threshold(self):
+        """Reuse the last calibration for this microphone, returns False if missing or stale"""
+        try:
+            if time.time() - ENERGY_FILE.stat().st_mtime > ENERGY_MAX_AGE:
+                return False
+            data = load_json(ENERGY_FILE)
+            if data["microphone_index"] != self.config.get("microphone_index"):
+                return False
+            self.recognizer.energy_threshold = float(data["energy_threshold"])
+            logger.info(f"✓ Calibration (cached): energy threshold {self.recognizer.energy_threshold:.1f}")
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+    
+    def _save_energy_threshold(self):
+        """Persist the calibrated threshold next to the other ~/.linny state"""
+        try:
+            ENERGY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            dump_json(ENERGY_FILE, {
+                "energy_threshold": self.recognizer.energy_threshold,
+                "microphone_index": self.config.get("microphone_index"),
+            })
+        except OSError as e:
+            logger.warning(f"Could not cache calibration: {e}")
+    
     def start_listening(self):
         """Start listening with retry logic"""
         if not self.is_listening:
@@ -1233,13 +2404,15 @@ class LinnyAssistant:
             
             for attempt in range(max_retries):
                 try:
-                    self._audio_source = self.microphone.__enter__()
+                    self._open_audio_source()
                     logger.info("✓ Audio source opened")
                     
-                    # ONE-TIME CALIBRATION (not in loop!)
-                    logger.info("📊 Calibrating ambient noise...")
-                    self.recognizer.adjust_for_ambient_noise(self._audio_source, duration=1)
-                    logger.info("✓ Calibration complete")
+                    # ONE-TIME CALIBRATION (not in loop!) - skipped if a fresh threshold is cached
+                    if not self._load_energy_threshold():
+                        logger.info("📊 Calibrating ambient noise...")
+                        self.recognizer.adjust_for_ambient_noise(self._audio_source, duration=1)
+                        logger.info("✓ Calibration complete")
+                        self._save_energy_threshold()
                     
                     # OPTIMIZED PARAMETERS for maximum responsiveness
                     self.recognizer.pause_threshold = 0.6  # Faster end-of-speech detection
@@ -1257,7 +2430,7 @@ class LinnyAssistant:
                     else:
                         logger.error("❌ CRITICAL: Could not initialize microphone after 3 attempts!")
                         try:
-                            self.voice.speak("Microphone initialization failed. Please check your audio devices.")
+                            self._say("Microphone initialization failed. Please check your audio devices.")
                         except Exception:
                             pass
                         return  # Don't start listener if mic failed
@@ -1269,12 +2442,10 @@ class LinnyAssistant:
     def stop_listening(self):
         """Stop listening"""
         self.is_listening = False
-        if self._audio_source:
-            try:
-                self.microphone.__exit__(None, None, None)
-                
-            except Exception as e:
-                logger.warning(f"Close audio failed: {e}")
+        self._recognize_pool.shutdown(wait=False, cancel_futures=True)
+        self._command_pool.shutdown(wait=False, cancel_futures=True)
+        self._brain_pool.shutdown(wait=False, cancel_futures=True)
+        self._close_audio_source()
     
     def toggle_mute(self):
         """Toggle mute"""
@@ -1291,7 +2462,12 @@ class LinnyApp:
     
     def __init__(self, headless=False):
         self.headless = headless
+        self._shutdown = threading.Event()  # Set by _exit_app to release run()
         self.config = self._load_config()
+        # Widgets exist only once _setup_gui() has run (headless builds it on demand)
+        self.root = None
+        self.status_label = None
+        self.mute_btn = None
         
         # Initialize components
         self.voice = VoiceEngine(self.config.get("voice_en", "en-PH-RosaNeural"))
@@ -1316,6 +2492,9 @@ class LinnyApp:
         # Start tray
         self.tray.start()
         
+        # Pay slow first-use imports now instead of inside a voice command
+        threading.Thread(target=self._warm_up, daemon=True, name="linny-warmup").start()
+        
         # GLOBAL HOTKEY: Ctrl+Shift+Del for instant mute/interrupt
         try:
             keyboard.add_hotkey('ctrl+shift+del', self._hotkey_interrupt)
@@ -1325,17 +2504,29 @@ class LinnyApp:
         
         # High priority
         try:
-            psutil.Process(os.getpid()).nice(psutil.HIGH_PRIORITY_CLASS)
+            set_high_priority()
             logger.info("✓ High priority set")
         except Exception as e:
             logger.warning(f"Priority failed: {e}")
+        
+        # Startup objects live for the whole session: move them out of GC scans
+        gc.freeze()
+    
+    def _warm_up(self):
+        """Background: preload pywhatkit (YouTube) and user32 (lock) off the command path"""
+        try:
+            import pywhatkit  # noqa: F401 - Lazy import, warmed here
+            logger.info("✓ pywhatkit preloaded")
+        except Exception as e:
+            logger.warning(f"pywhatkit preload failed: {e}")
+        if sys.platform == "win32":
+            ctypes.windll.user32
     
     def _load_default_config(self):
         """Load default config from JSON file"""
         try:
             if DEFAULT_CONFIG_FILE.exists():
-                with open(DEFAULT_CONFIG_FILE, 'r') as f:
-                    return json.load(f)
+                return load_json(DEFAULT_CONFIG_FILE)
         except Exception as e:
             logger.error(f"Failed to load default config: {e}")
         
@@ -1359,8 +2550,7 @@ class LinnyApp:
         """Load config, use defaults if not found"""
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    return json.load(f)
+                return load_json(CONFIG_FILE)
             except json.JSONDecodeError as e:
                 logger.error(f"Config JSON error: {e}")
                 default = self._load_default_config()
@@ -1375,8 +2565,7 @@ class LinnyApp:
     def _save_config_impl(self, config):
         """Save config"""
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        dump_json(CONFIG_FILE, config)
     
     def _save_config(self):
         """Save config"""
@@ -1489,15 +2678,15 @@ class LinnyApp:
         
         self._save_config()
         
-        # Reinit brain and lights
-        self.brain = BrainManager(self.config)
-        self.assistant.brain = self.brain
+        # Brain keeps its connection pool/cache; lights are rebuilt
+        self.brain.reconfigure(self.config)
         
+        self.lights.close()
         self.lights = LightManager(self.config)
         self.assistant.lights = self.lights
         
         logger.info("✓ Settings saved")
-        if hasattr(self, 'status_label'):
+        if self.status_label is not None:
             self.status_label.configure(text="Status: Settings Saved!")
     
     def _edit_aliases(self):
@@ -1505,14 +2694,18 @@ class LinnyApp:
         try:
             if not CONFIG_FILE.exists():
                 self._save_config()
-            subprocess.Popen(['notepad.exe', str(CONFIG_FILE)])
+            if sys.platform == "win32":
+                # ShellExecute: no Popen object or inherited handles kept around
+                os.startfile("notepad.exe", arguments=f'"{CONFIG_FILE}"')
+            else:
+                webbrowser.open(CONFIG_FILE.as_uri())
             logger.info("✓ Config editor opened")
         except Exception as e:
             logger.error(f"Failed to open editor: {e}")
     
     def _show_dashboard(self):
         """Show GUI (create on-demand if in headless mode)"""
-        if not hasattr(self, 'root'):
+        if self.root is None:
             # GUI was never created (headless mode) - create it now
             logger.info("📊 Creating dashboard on-demand...")
             self._setup_gui()
@@ -1526,7 +2719,7 @@ class LinnyApp:
     
     def _hide_dashboard(self):
         """Hide GUI"""
-        if hasattr(self, 'root'):
+        if self.root is not None:
             self.root.withdraw()
     
     def _toggle_mute(self):
@@ -1535,14 +2728,14 @@ class LinnyApp:
         self.tray.update_state("muted" if is_muted else "listening")
         
         # Update button text and color
-        if hasattr(self, 'mute_btn'):
+        if self.mute_btn is not None:
             if is_muted:
                 self.mute_btn.configure(text="Unmute", fg_color="#d32f2f")  # Red when muted
             else:
                 self.mute_btn.configure(text="Mute", fg_color="#2196f3")    # Blue when active
         
         # Status feedback
-        if hasattr(self, 'status_label'):
+        if self.status_label is not None:
             status_text = "🔇 Muted" if is_muted else "🎤 Listening"
             self.status_label.configure(text=f"Status: {status_text}")
         
@@ -1552,7 +2745,7 @@ class LinnyApp:
         """Start listening"""
         self.assistant.start_listening()
         self.tray.update_state("listening")
-        if hasattr(self, 'status_label'):
+        if self.status_label is not None:
             self.status_label.configure(text="Status: Listening...")
     
     def _hotkey_interrupt(self):
@@ -1594,8 +2787,7 @@ class LinnyApp:
             # HIGH PRIORITY: Ensure Linny loads before other startup apps
             # ================================================================
             try:
-                p = psutil.Process()
-                p.nice(psutil.HIGH_PRIORITY_CLASS)
+                set_high_priority()
                 logger.info("✓ Process priority set to HIGH")
             except Exception as e:
                 logger.warning(f"Could not set high priority: {e}")
@@ -1620,8 +2812,7 @@ class LinnyApp:
                 try:
                     
                     # Get timezone and current time
-                    tz = pytz.timezone(self.config.get("timezone", "Asia/Manila"))
-                    now = datetime.now(tz)
+                    now = datetime.now(self.assistant.tz)
                     
                     # Build greeting
                     hour = now.hour
@@ -1660,7 +2851,7 @@ class LinnyApp:
                     logger.info(f"✨ [ASYNC] Greeting ready: {full_greeting}")
                     
                     # Speak greeting (user will hear this after unlocking)
-                    self.voice.speak(full_greeting)
+                    self.assistant._say(full_greeting)
                     
                 except Exception as e:
                     logger.error(f"Async greeting error: {e}")
@@ -1679,17 +2870,21 @@ class LinnyApp:
         """Exit"""
         logger.info("Exiting...")
         self.assistant.stop_listening()
+        self.brain.close()
+        self.lights.close()
+        self.voice.close()
         self.tray.stop()
-        if hasattr(self, 'root'):
+        if self.root is not None:
             self.root.quit()
+        self._shutdown.set()
         sys.exit(0)
     
     def run(self):
         """Run app"""
         if self.headless:
             try:
-                while True:
-                    time.sleep(1)
+                # Block without polling until _exit_app signals shutdown
+                self._shutdown.wait()
             except KeyboardInterrupt:
                 self._exit_app()
         else: